@@ -4,15 +4,396 @@ Tracks all system activities for security and compliance.
 
 Last updated: 2025-08-30 22:40:55 UTC by nullroute-commits
 """
+import atexit
+import io
+import json
 import logging
-from typing import Any, Dict, Optional, List
+import queue
+import random
+import re
+import threading
+import time
+import uuid
+from contextvars import ContextVar
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional, List, Tuple
 from functools import wraps
 from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from sqlalchemy import inspect, select, text
+from sqlalchemy.exc import NoInspectionAvailable
 from app.core.db.connection import get_db_session
-from app.core.models import AuditLog
+from app.core.models import (
+    AUDIT_PARTITION_MONTHS_AHEAD, AuditLog, bulk_insert_audit, create_audit_partitions, month_start, uuid7
+)
 
 logger = logging.getLogger(__name__)
 
+# Settings resolved once at import; hot paths test these globals
+AUDIT_ENABLED = getattr(settings, 'AUDIT_ENABLED', True)
+AUDIT_LOG_MODELS = getattr(settings, 'AUDIT_LOG_MODELS', True)
+AUDIT_LOG_REQUESTS = getattr(settings, 'AUDIT_LOG_REQUESTS', True)
+AUDIT_LOG_AUTHENTICATION = getattr(settings, 'AUDIT_LOG_AUTHENTICATION', True)
+
+# Process-wide audit logger, created on first use
+_audit_logger: Optional['AuditLogger'] = None
+_audit_logger_lock = threading.Lock()
+
+# Keys containing any of these fragments are redacted before logging
+SENSITIVE_FIELDS = (
+    'password', 'password_hash', 'token', 'secret', 'key',
+    'authorization', 'cookie', 'session', 'csrf_token'
+)
+_SENSITIVE_RE = re.compile('|'.join(map(re.escape, SENSITIVE_FIELDS)), re.IGNORECASE)
+
+# Model changes collected by the active AuditContext, keyed by (resource_type, resource_id)
+_audit_batch: ContextVar[Optional[Dict[tuple, Dict[str, Any]]]] = ContextVar('_audit_batch', default=None)
+
+# Whether a model class provides to_dict(), cached per class
+_HAS_TO_DICT: Dict[type, bool] = {}
+
+# Columns populated by log_activity, in COPY order
+_COPY_COLUMNS = (
+    'id', 'created_at', 'updated_at', 'user_id', 'session_id', 'ip_address', 'user_agent',
+    'action', 'resource_type', 'resource_id', 'resource_repr', 'old_values', 'new_values',
+    'request_method', 'request_path', 'request_data', 'response_status', 'metadata', 'message'
+)
+_COPY_SQL = f"COPY {AuditLog.__tablename__} ({', '.join(_COPY_COLUMNS)}) FROM STDIN"
+_COPY_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r'})
+
+# Monthly partitions created by ensure_audit_partitions
+_PARTITION_NAME_RE = re.compile(rf'{AuditLog.__tablename__}_\d{{4}}_\d{{2}}')
+
+# Columns returned by history queries; request_data is omitted as it can be large
+_HISTORY_COLUMNS = tuple(
+    column for column in AuditLog.__table__.columns if column.name != 'request_data'
+)
+
+
+class AuditLogWriter:
+    """
+    Background writer that batches audit log inserts.
+
+    Audit rows are enqueued on a bounded in-process queue and flushed to the
+    database by a daemon thread, so the request path never waits on a commit.
+    When the queue is full new rows are dropped and counted in
+    ``journal_dropped`` rather than blocking the caller.
+
+    With ``backend='rabbitmq'`` batches are published to ``queue_name`` and
+    written by ``consume_audit_batches`` in a separate worker process, so
+    web workers never touch the audit database. A batch that cannot be
+    published is written directly instead.
+    """
+
+    def __init__(self, max_size: int = 10000, batch_size: int = 500,
+                 flush_interval_ms: int = 200, backend: str = 'database',
+                 queue_name: str = 'audit.write'):
+        """
+        Initialize the audit log writer.
+
+        Args:
+            max_size: Maximum number of pending rows
+            batch_size: Maximum number of rows written per transaction
+            flush_interval_ms: Maximum time to wait for a batch to fill
+            backend: 'database' to insert directly, 'rabbitmq' to publish batches
+            queue_name: Queue (and routing key) used by the rabbitmq backend
+        """
+        self.backend = backend
+        self.queue_name = queue_name
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval_ms / 1000.0
+        self.journal_dropped = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=max_size)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def enqueue(self, row: Dict[str, Any]) -> bool:
+        """
+        Queue a row for writing without blocking.
+
+        Args:
+            row: AuditLog column values
+
+        Returns:
+            True if queued, False if the row was dropped
+        """
+        if self._thread is None:
+            self._start()
+
+        try:
+            self._queue.put_nowait(row)
+            return True
+        except queue.Full:
+            self.journal_dropped += 1
+            return False
+
+    def flush(self) -> None:
+        """Write all pending rows synchronously."""
+        while True:
+            batch = self._drain(block=False)
+            if not batch:
+                return
+            self._write(batch)
+
+    def _start(self) -> None:
+        """Start the background flush thread once."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name='audit-log-writer', daemon=True)
+            self._thread.start()
+            atexit.register(self.flush)
+
+    def _run(self) -> None:
+        """Flush batches until the process exits."""
+        while True:
+            batch = self._drain(block=True)
+            if batch:
+                self._write(batch)
+
+    def _drain(self, block: bool) -> List[Dict[str, Any]]:
+        """
+        Collect up to ``batch_size`` rows from the queue.
+
+        Args:
+            block: Whether to wait up to the flush interval for rows
+
+        Returns:
+            List of rows, possibly empty
+        """
+        batch: List[Dict[str, Any]] = []
+        deadline = time.monotonic() + self.flush_interval
+
+        while len(batch) < self.batch_size:
+            try:
+                if block:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    batch.append(self._queue.get(timeout=remaining))
+                else:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+
+        return batch
+
+    def _write(self, batch: List[Dict[str, Any]]) -> None:
+        """Hand a batch to the configured backend."""
+        if self.backend == 'rabbitmq' and self._publish(batch):
+            return
+        write_audit_batch(batch)
+
+    def _publish(self, batch: List[Dict[str, Any]]) -> bool:
+        """
+        Publish a batch to the audit queue.
+
+        Args:
+            batch: Rows keyed by column name
+
+        Returns:
+            True if the batch was published
+        """
+        try:
+            from app.core.queue.rabbitmq import get_rabbitmq_client
+            client = get_rabbitmq_client()
+            # Unbound routing keys are dropped by the exchange, so make sure the
+            # queue exists before the first batch instead of waiting for a consumer
+            client.bind_queue(self.queue_name)
+            # Only JSON primitives cross the queue
+            return client.publish(self.queue_name, json.dumps(batch, default=str))
+        except Exception as e:
+            logger.error(f"Failed to publish {len(batch)} audit log entries: {str(e)}")
+            return False
+
+
+def write_audit_batch(batch: List[Dict[str, Any]]) -> None:
+    """
+    Insert a batch of audit rows, dropping only the rows that cannot be written.
+
+    Args:
+        batch: Rows keyed by column name
+    """
+    try:
+        _insert_batch(batch)
+    except Exception as e:
+        logger.error(f"Failed to write {len(batch)} audit log entries: {str(e)}")
+
+
+def consume_audit_batches(queue_name: Optional[str] = None) -> None:
+    """
+    Write batches published by the rabbitmq audit backend until interrupted.
+
+    Run in a dedicated worker process. Messages are acknowledged only after
+    the batch has been committed.
+
+    Args:
+        queue_name: Queue to consume, defaults to AUDIT_QUEUE_NAME
+    """
+    from app.core.queue.rabbitmq import get_rabbitmq_client
+
+    def handle(message, properties, method):
+        rows = []
+        for row in message:
+            try:
+                rows.append(_decode_row(row))
+            except (TypeError, ValueError) as e:
+                logger.error(f"Skipping undecodable audit log entry: {str(e)}")
+        # Raising leaves the message to the dead-letter queue
+        if rows:
+            _insert_batch(rows)
+
+    get_rabbitmq_client().consume(
+        queue_name or getattr(settings, 'AUDIT_QUEUE_NAME', 'audit.write'), handle
+    )
+
+
+def _insert_batch(batch: List[Dict[str, Any]]) -> None:
+    """
+    Insert a batch, falling back to one row per transaction if it fails.
+
+    A bad row fails the whole COPY or executemany, so only the rows that
+    also fail on their own are dropped.
+
+    Args:
+        batch: Rows keyed by column name
+
+    Raises:
+        Exception: The last error if no row could be written
+    """
+    try:
+        _insert_rows(batch)
+        return
+    except Exception as e:
+        if len(batch) == 1:
+            raise
+        logger.warning(f"Audit batch of {len(batch)} entries failed, retrying per row: {str(e)}")
+
+    failed = 0
+    last_error: Optional[Exception] = None
+    for row in batch:
+        try:
+            _insert_rows([row])
+        except Exception as e:
+            failed += 1
+            last_error = e
+            logger.error(f"Dropped audit log entry {row.get('id')}: {str(e)}")
+
+    if last_error is not None and failed == len(batch):
+        raise last_error
+
+
+def _insert_rows(batch: List[Dict[str, Any]]) -> None:
+    """
+    Insert rows in one transaction, using COPY on PostgreSQL and executemany elsewhere.
+
+    Args:
+        batch: Rows keyed by column name
+    """
+    with get_db_session() as session:
+        if session.get_bind().dialect.name == 'postgresql':
+            _copy_batch(session, batch)
+        else:
+            bulk_insert_audit(session, batch)
+        session.commit()
+
+
+def _decode_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Restore UUID and datetime values of a row received from the queue.
+
+    Args:
+        row: Row decoded from JSON
+
+    Returns:
+        Row with typed values
+    """
+    for column in ('id', 'user_id', 'resource_id'):
+        if row.get(column) is not None:
+            row[column] = uuid.UUID(row[column])
+    for column in ('created_at', 'updated_at'):
+        if row.get(column) is not None:
+            row[column] = datetime.fromisoformat(row[column])
+    return row
+
+
+def _copy_batch(session, batch: List[Dict[str, Any]]) -> None:
+    """
+    Stream a batch into PostgreSQL with COPY FROM STDIN.
+
+    Args:
+        session: Database session whose transaction the COPY joins
+        batch: Rows keyed by column name
+    """
+    data = ''.join(
+        '\t'.join(_copy_value(row.get(column)) for column in _COPY_COLUMNS) + '\n'
+        for row in batch
+    )
+    driver_connection = session.connection().connection.driver_connection
+    cursor = driver_connection.cursor()
+    try:
+        if hasattr(cursor, 'copy'):
+            # psycopg 3
+            with cursor.copy(_COPY_SQL) as copy:
+                copy.write(data)
+        else:
+            # psycopg2
+            cursor.copy_expert(_COPY_SQL, io.StringIO(data))
+    finally:
+        cursor.close()
+
+
+def _attribute_changes(instance: Any) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
+    """
+    Diff the changed column attributes of a mapped instance.
+
+    Must be called before the session flushes, which resets the history.
+
+    Args:
+        instance: SQLAlchemy model instance
+
+    Returns:
+        (old_values, new_values) for changed columns, or None if the
+        object is not mapped or nothing changed
+    """
+    try:
+        state = inspect(instance)
+    except NoInspectionAvailable:
+        return None
+
+    old_values: Dict[str, Any] = {}
+    new_values: Dict[str, Any] = {}
+    for attr in state.mapper.column_attrs:
+        history = state.attrs[attr.key].history
+        if history.has_changes():
+            old_values[attr.key] = history.deleted[0] if history.deleted else None
+            new_values[attr.key] = history.added[0] if history.added else None
+
+    if not new_values:
+        return None
+    return old_values, new_values
+
+
+def _copy_value(value: Any) -> str:
+    """
+    Encode a value as a field in COPY text format.
+
+    Args:
+        value: Column value
+
+    Returns:
+        Escaped field text, ``\\N`` for NULL
+    """
+    if value is None:
+        return '\\N'
+    if isinstance(value, (dict, list)):
+        value = json.dumps(value, default=str)
+    elif isinstance(value, datetime):
+        value = value.isoformat()
+    else:
+        value = str(value)
+    return value.translate(_COPY_ESCAPES)
+
 
 class AuditLogger:
     """
@@ -28,10 +409,18 @@ class AuditLogger:
 
     def __init__(self):
         """Initialize audit logger."""
-        self.enabled = getattr(settings, 'AUDIT_ENABLED', True)
-        self.log_models = getattr(settings, 'AUDIT_LOG_MODELS', True)
-        self.log_requests = getattr(settings, 'AUDIT_LOG_REQUESTS', True)
-        self.log_authentication = getattr(settings, 'AUDIT_LOG_AUTHENTICATION', True)
+        self.log_models = AUDIT_LOG_MODELS
+        self.log_requests = AUDIT_LOG_REQUESTS
+        self.log_authentication = AUDIT_LOG_AUTHENTICATION
+        self.history_days = getattr(settings, 'AUDIT_HISTORY_DAYS', 90)
+        self.sample_rules = self._compile_sample_rules(getattr(settings, 'AUDIT_SAMPLE_RULES', None))
+        self.writer = AuditLogWriter(
+            max_size=getattr(settings, 'AUDIT_QUEUE_SIZE', 10000),
+            batch_size=getattr(settings, 'AUDIT_BATCH_SIZE', 500),
+            flush_interval_ms=getattr(settings, 'AUDIT_FLUSH_INTERVAL_MS', 200),
+            backend=getattr(settings, 'AUDIT_BACKEND', 'database'),
+            queue_name=getattr(settings, 'AUDIT_QUEUE_NAME', 'audit.write'),
+        )
 
     def log_activity(self,
                      action: str,
@@ -72,9 +461,9 @@ class AuditLogger:
             message: Human-readable message
 
         Returns:
-            Audit log UUID if successful, None otherwise
+            Audit log UUID if queued, None otherwise
         """
-        if not self.enabled:
+        if not AUDIT_ENABLED:
             return None
 
         try:
@@ -83,31 +472,36 @@ class AuditLogger:
             sanitized_old_values = self._sanitize_data(old_values) if old_values else None
             sanitized_new_values = self._sanitize_data(new_values) if new_values else None
 
-            with get_db_session() as session:
-                audit_log = AuditLog(
-                    user_id=user_id,
-                    session_id=session_id,
-                    ip_address=ip_address,
-                    user_agent=user_agent,
-                    action=action,
-                    resource_type=resource_type,
-                    resource_id=resource_id,
-                    resource_repr=resource_repr,
-                    old_values=sanitized_old_values,
-                    new_values=sanitized_new_values,
-                    request_method=request_method,
-                    request_path=request_path,
-                    request_data=sanitized_request_data,
-                    response_status=response_status,
-                    metadata=metadata,
-                    message=message
-                )
-
-                session.add(audit_log)
-                session.commit()
-
-                logger.debug(f"Logged audit activity: {action} by user {user_id}")
-                return str(audit_log.id)
+            audit_id = uuid7()
+            now = datetime.now(timezone.utc)
+            row = {
+                'id': audit_id,
+                'created_at': now,
+                'updated_at': now,
+                'user_id': user_id,
+                'session_id': session_id,
+                'ip_address': ip_address,
+                'user_agent': user_agent,
+                'action': action,
+                'resource_type': resource_type,
+                'resource_id': resource_id,
+                'resource_repr': resource_repr,
+                'old_values': sanitized_old_values,
+                'new_values': sanitized_new_values,
+                'request_method': request_method,
+                'request_path': request_path,
+                'request_data': sanitized_request_data,
+                'response_status': response_status,
+                'metadata': metadata,
+                'message': message,
+            }
+
+            # Writes are batched in the background; the ID is valid once flushed
+            if not self.writer.enqueue(row):
+                return None
+
+            logger.debug("Queued audit activity: %s by user %s", action, user_id)
+            return str(audit_id)
 
         except Exception as e:
             logger.error(f"Failed to log audit activity: {str(e)}")
@@ -130,32 +524,69 @@ class AuditLogger:
             session_info: Session information
 
         Returns:
-            Audit log UUID if successful, None otherwise
+            Audit log UUID if successful, None otherwise (including when the
+            change is deferred by an active AuditContext)
         """
-        if not self.enabled or not self.log_models:
+        if not AUDIT_ENABLED or not self.log_models:
             return None
 
         try:
             resource_type = model_instance.__class__.__name__
-            resource_id = str(getattr(model_instance, 'id', None))
+            # Unsaved instances have no id yet; "None" is not a valid resource_id
+            instance_id = getattr(model_instance, 'id', None)
+            resource_id = str(instance_id) if instance_id is not None else None
             resource_repr = str(model_instance)
 
-            new_values = None
-            if hasattr(model_instance, 'to_dict'):
-                new_values = model_instance.to_dict()
-
-            return self.log_activity(
-                action=action,
-                user_id=user_id,
-                session_id=session_info.get('session_id') if session_info else None,
-                ip_address=session_info.get('ip_address') if session_info else None,
-                user_agent=session_info.get('user_agent') if session_info else None,
-                resource_type=resource_type,
-                resource_id=resource_id,
-                resource_repr=resource_repr,
-                old_values=old_values,
-                new_values=new_values
-            )
+            cls = type(model_instance)
+            has_to_dict = _HAS_TO_DICT.get(cls)
+            if has_to_dict is None:
+                has_to_dict = _HAS_TO_DICT[cls] = hasattr(cls, 'to_dict')
+
+            change = {
+                'action': action,
+                'user_id': user_id,
+                'session_id': session_info.get('session_id') if session_info else None,
+                'ip_address': session_info.get('ip_address') if session_info else None,
+                'user_agent': session_info.get('user_agent') if session_info else None,
+                'resource_type': resource_type,
+                'resource_id': resource_id,
+                'resource_repr': resource_repr,
+                'old_values': old_values,
+                'new_values': None,
+            }
+
+            # UPDATEs without explicit old values record only the changed
+            # attributes, read from the unflushed attribute history
+            diff = None
+            if action == 'UPDATE' and old_values is None:
+                diff = _attribute_changes(model_instance)
+            if diff is not None:
+                change['old_values'], change['new_values'] = diff
+
+            # Snapshot now: by the time an AuditContext exits the instance has
+            # usually been expired by commit and detached by close
+            if has_to_dict and diff is None:
+                change['new_values'] = model_instance.to_dict()
+
+            batch = _audit_batch.get()
+            if batch is None:
+                return self.log_activity(**change)
+
+            # Unsaved instances are told apart by identity rather than all sharing None
+            key = (resource_type, resource_id if resource_id is not None else id(model_instance))
+            previous = batch.get(key)
+            if previous is not None:
+                # Keep the first action and old values unless the resource was deleted
+                if diff is not None and previous['old_values'] is not None:
+                    change['old_values'] = {**diff[0], **previous['old_values']}
+                else:
+                    change['old_values'] = previous['old_values']
+                if diff is not None and previous['new_values'] is not None:
+                    change['new_values'] = {**previous['new_values'], **diff[1]}
+                if action != 'DELETE':
+                    change['action'] = previous['action']
+            batch[key] = change
+            return None
 
         except Exception as e:
             logger.error(f"Failed to log model change: {str(e)}")
@@ -182,7 +613,7 @@ class AuditLogger:
         Returns:
             Audit log UUID if successful, None otherwise
         """
-        if not self.enabled or not self.log_authentication:
+        if not AUDIT_ENABLED or not self.log_authentication:
             return None
 
         auth_metadata = metadata or {}
@@ -235,7 +666,10 @@ class AuditLogger:
         Returns:
             Audit log UUID if successful, None otherwise
         """
-        if not self.enabled or not self.log_requests:
+        if not AUDIT_ENABLED or not self.log_requests:
+            return None
+
+        if not self._should_log_request(request_method, response_status):
             return None
 
         return self.log_activity(
@@ -251,6 +685,48 @@ class AuditLogger:
             metadata=metadata
         )
 
+    def _compile_sample_rules(self, rules: Optional[List]) -> List[tuple]:
+        """
+        Normalize request sampling rules.
+
+        Each rule is a ``(method, status_range, rate)`` tuple. ``method`` may be
+        ``'*'`` and ``status_range`` may be ``None`` to match anything. Rules
+        are checked in order and the first match decides the sample rate.
+
+        Args:
+            rules: Sampling rules, or None to sample only successful GETs
+
+        Returns:
+            List of (method, low, high, rate) tuples
+        """
+        if rules is None:
+            rules = [('GET', (200, 399), getattr(settings, 'AUDIT_GET_SAMPLE_RATE', 1.0))]
+
+        compiled = []
+        for method, status_range, rate in rules:
+            low, high = status_range if status_range else (0, 999)
+            compiled.append((None if method == '*' else method.upper(), low, high, float(rate)))
+        return compiled
+
+    def _should_log_request(self, request_method: str, response_status: Optional[int]) -> bool:
+        """
+        Decide whether a request is sampled into the audit log.
+
+        Args:
+            request_method: HTTP method
+            response_status: HTTP response status
+
+        Returns:
+            True if the request should be logged
+        """
+        for method, low, high, rate in self.sample_rules:
+            if method is not None and method != request_method:
+                continue
+            if response_status is None or not low <= response_status <= high:
+                continue
+            return rate >= 1.0 or random.random() < rate
+        return True
+
     def get_user_activity(self,
                           user_id: str,
                           limit: int = 100,
@@ -266,20 +742,27 @@ class AuditLogger:
             action_filter: Filter by action type
 
         Returns:
-            List of audit log dictionaries
+            List of audit log dictionaries (without request_data)
         """
         try:
-            with get_db_session() as session:
-                query = session.query(AuditLog).filter(AuditLog.user_id == user_id)
+            stmt = select(*_HISTORY_COLUMNS).where(AuditLog.user_id == user_id)
+
+            cutoff = self._history_cutoff()
+            if cutoff is not None:
+                stmt = stmt.where(AuditLog.created_at >= cutoff)
 
-                if action_filter:
-                    query = query.filter(AuditLog.action == action_filter)
+            if action_filter:
+                stmt = stmt.where(AuditLog.action == action_filter)
 
-                query = query.order_by(AuditLog.created_at.desc())
-                query = query.offset(offset).limit(limit)
+            stmt = (
+                stmt.order_by(AuditLog.created_at.desc())
+                .offset(offset)
+                .limit(limit)
+                .execution_options(yield_per=200)
+            )
 
-                logs = query.all()
-                return [log.to_dict() for log in logs]
+            with get_db_session() as session:
+                return [dict(row) for row in session.execute(stmt).mappings()]
 
         except Exception as e:
             logger.error(f"Failed to get user activity: {str(e)}")
@@ -298,25 +781,44 @@ class AuditLogger:
             limit: Maximum number of records
 
         Returns:
-            List of audit log dictionaries
+            List of audit log dictionaries (without request_data)
         """
         try:
-            with get_db_session() as session:
-                query = session.query(AuditLog).filter(
-                    AuditLog.resource_type == resource_type,
-                    AuditLog.resource_id == resource_id
-                )
+            stmt = select(*_HISTORY_COLUMNS).where(
+                AuditLog.resource_type == resource_type,
+                AuditLog.resource_id == resource_id
+            )
 
-                query = query.order_by(AuditLog.created_at.desc())
-                query = query.limit(limit)
+            cutoff = self._history_cutoff()
+            if cutoff is not None:
+                stmt = stmt.where(AuditLog.created_at >= cutoff)
 
-                logs = query.all()
-                return [log.to_dict() for log in logs]
+            stmt = (
+                stmt.order_by(AuditLog.created_at.desc())
+                .limit(limit)
+                .execution_options(yield_per=200)
+            )
+
+            with get_db_session() as session:
+                return [dict(row) for row in session.execute(stmt).mappings()]
 
         except Exception as e:
             logger.error(f"Failed to get resource history: {str(e)}")
             return []
 
+    def _history_cutoff(self) -> Optional[datetime]:
+        """
+        Get the oldest timestamp returned by history queries.
+
+        Bounding created_at lets PostgreSQL prune old audit_logs partitions.
+
+        Returns:
+            Cutoff datetime, or None if history is unbounded
+        """
+        if not self.history_days:
+            return None
+        return datetime.now(timezone.utc) - timedelta(days=self.history_days)
+
     def _sanitize_data(self, data: Dict) -> Dict:
         """
         Sanitize sensitive data from logs.
@@ -330,28 +832,121 @@ class AuditLogger:
         if not isinstance(data, dict):
             return data
 
-        sensitive_fields = {
-            'password', 'password_hash', 'token', 'secret', 'key',
-            'authorization', 'cookie', 'session', 'csrf_token'
-        }
-
-        sanitized = {}
-        for key, value in data.items():
-            key_lower = key.lower()
-            if any(sensitive in key_lower for sensitive in sensitive_fields):
-                sanitized[key] = '[REDACTED]'
-            elif isinstance(value, dict):
-                sanitized[key] = self._sanitize_data(value)
-            elif isinstance(value, list):
-                sanitized[key] = [self._sanitize_data(item) if isinstance(item, dict) else item for item in value]
-            else:
-                sanitized[key] = value
+        # Walk nested containers with an explicit stack instead of recursion
+        sanitized: Dict = {}
+        stack = [(data, sanitized)]
+        while stack:
+            source, target = stack.pop()
+            for key, value in source.items():
+                if _SENSITIVE_RE.search(key):
+                    target[key] = '[REDACTED]'
+                elif isinstance(value, dict):
+                    child = {}
+                    target[key] = child
+                    stack.append((value, child))
+                elif isinstance(value, list):
+                    items = []
+                    for item in value:
+                        if isinstance(item, dict):
+                            child = {}
+                            items.append(child)
+                            stack.append((item, child))
+                        else:
+                            items.append(item)
+                    target[key] = items
+                else:
+                    target[key] = value
 
         return sanitized
 
 
 # Global audit logger instance
-audit_logger = AuditLogger()
+def get_audit_logger() -> AuditLogger:
+    """
+    Get or create the process-wide audit logger.
+
+    Returns:
+        AuditLogger instance
+    """
+    global _audit_logger
+    if _audit_logger is None:
+        with _audit_logger_lock:
+            if _audit_logger is None:
+                _audit_logger = AuditLogger()
+
+    return _audit_logger
+
+
+def __getattr__(name: str) -> Any:
+    """Create ``audit_logger`` lazily on first access."""
+    if name == 'audit_logger':
+        return get_audit_logger()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class AuditContext:
+    """
+    Context manager that squashes repeated model changes into one audit row.
+
+    While active, log_model_change records at most one pending change per
+    resource, keeping the earliest old values and the latest new values.
+    The squashed changes are logged when the context exits.
+
+    Usage:
+        with AuditContext():
+            # Save models
+            pass
+    """
+
+    def __init__(self, logger_instance: Optional[AuditLogger] = None):
+        """
+        Initialize the audit context.
+
+        Args:
+            logger_instance: Audit logger used to emit changes on exit
+        """
+        self.audit_logger = logger_instance or get_audit_logger()
+        self._token = None
+
+    def __enter__(self) -> 'AuditContext':
+        """Start collecting model changes."""
+        self._token = _audit_batch.set({})
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Emit the collected model changes."""
+        changes = _audit_batch.get() or {}
+        _audit_batch.reset(self._token)
+        for change in changes.values():
+            self.audit_logger.log_activity(**change)
+
+
+class AuditContextMiddleware:
+    """
+    Django middleware that wraps each request in an AuditContext.
+
+    Add 'app.core.audit.AuditContextMiddleware' to MIDDLEWARE to squash
+    model change audit rows per request.
+    """
+
+    def __init__(self, get_response):
+        """
+        Initialize the middleware.
+
+        Args:
+            get_response: Next handler in the middleware chain
+
+        Raises:
+            MiddlewareNotUsed: If model auditing is disabled
+        """
+        if not (AUDIT_ENABLED and AUDIT_LOG_MODELS):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        """Handle a request inside an audit context."""
+        with AuditContext():
+            return self.get_response(request)
 
 
 # Decorator functions for automatic auditing
@@ -367,8 +962,13 @@ def audit_activity(action: str, resource_type: Optional[str] = None):
         Decorated function
     """
     def decorator(func):
+        if not AUDIT_ENABLED:
+            return func
+
         @wraps(func)
         def wrapper(*args, **kwargs):
+            audit_logger = get_audit_logger()
+
             # Extract user and session info from kwargs if available
             user_id = kwargs.get('user_id')
             session_info = kwargs.get('session_info', {})
@@ -420,35 +1020,19 @@ def audit_model_changes(model_class):
     """
     Class decorator to automatically audit model changes.
 
+    Unflushed attribute history already records previous values, so
+    instances are not copied on construction.
+
     Args:
         model_class: Model class to audit
 
     Returns:
         Decorated model class
     """
-    original_init = model_class.__init__
-
-    def __init__(self, *args, **kwargs):
-        original_init(self, *args, **kwargs)
-        self._audit_original_values = None
-        if hasattr(self, 'to_dict'):
-            self._audit_original_values = self.to_dict()
-
-    model_class.__init__ = __init__
     return model_class
 
 
 # Helper functions
-def get_audit_logger() -> AuditLogger:
-    """
-    Get the global audit logger instance.
-
-    Returns:
-        AuditLogger instance
-    """
-    return audit_logger
-
-
 def log_user_activity(action: str, user_id: str, **kwargs) -> Optional[str]:
     """
     Log user activity.
@@ -461,4 +1045,69 @@ def log_user_activity(action: str, user_id: str, **kwargs) -> Optional[str]:
     Returns:
         Audit log UUID if successful, None otherwise
     """
-    return audit_logger.log_activity(action=action, user_id=user_id, **kwargs)
+    return get_audit_logger().log_activity(action=action, user_id=user_id, **kwargs)
+
+
+# Partition maintenance
+def ensure_audit_partitions(months_ahead: int = AUDIT_PARTITION_MONTHS_AHEAD) -> List[str]:
+    """
+    Create monthly audit_logs partitions from the current month onwards.
+
+    The table is created with its first months in place; run this
+    periodically (e.g. daily from cron) to keep partitions ahead of time.
+    Rows that reached the default partition in the meantime are moved
+    into the new monthly partitions.
+
+    Args:
+        months_ahead: Number of future months to pre-create
+
+    Returns:
+        Names of the partitions ensured
+    """
+    with get_db_session() as session:
+        created = create_audit_partitions(session.connection(), months_ahead)
+        session.commit()
+
+    return created
+
+
+def drop_expired_audit_partitions(retention_months: Optional[int] = None) -> List[str]:
+    """
+    Drop monthly audit_logs partitions that fall outside the retention window.
+
+    Dropping a partition replaces a bulk DELETE of its rows.
+
+    Args:
+        retention_months: Months to keep, defaults to AUDIT_RETENTION_MONTHS
+            (0 keeps everything)
+
+    Returns:
+        Names of the dropped partitions
+    """
+    if retention_months is None:
+        retention_months = getattr(settings, 'AUDIT_RETENTION_MONTHS', 0)
+    if not retention_months:
+        return []
+
+    table = AuditLog.__tablename__
+    cutoff = f"{table}_{month_start(datetime.now(timezone.utc), -retention_months):%Y_%m}"
+    dropped = []
+
+    with get_db_session() as session:
+        partitions = session.execute(text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE parent.relname = :table"
+        ), {'table': table}).scalars()
+
+        for name in partitions:
+            # Monthly partitions sort chronologically by name
+            if _PARTITION_NAME_RE.fullmatch(name) and name < cutoff:
+                session.execute(text(f"DROP TABLE IF EXISTS {name}"))
+                dropped.append(name)
+        session.commit()
+
+    if dropped:
+        logger.info(f"Dropped expired audit partitions: {', '.join(dropped)}")
+    return dropped
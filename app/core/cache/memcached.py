@@ -7,14 +7,153 @@ Last updated: 2025-08-30 22:40:55 UTC by nullroute-commits
 import os
 import logging
 import hashlib
+import pickle
+import re
 import threading
-import memcache
-from typing import Any, Dict, List, Optional, Union
+from functools import lru_cache, wraps
+from typing import Any, Dict, List, Optional, Tuple, Union
+from cachetools import TTLCache
+from pymemcache import serde
+from pymemcache.client.base import PooledClient
+from pymemcache.client.hash import HashClient
+
+try:
+    import pylibmc
+except ImportError:  # pragma: no cover - optional C driver
+    pylibmc = None
 
 logger = logging.getLogger(__name__)
 
-# Thread local storage for memcached client
-_thread_locals = threading.local()
+# Process-wide memcached client shared by all threads
+_memcached_client: Optional['MemcachedClient'] = None
+_memcached_client_lock = threading.Lock()
+
+# Memcached keys are limited to 250 bytes without whitespace or control characters
+MEMCACHED_MAX_KEY_LENGTH = 250
+_MEMCACHED_BAD_CHARS = re.compile(rb'[\x00-\x20\x7f-\xff]')
+
+# Only immutable values are kept in the in-process cache, which hands the
+# same object to every caller; anything else is unpickled fresh per get
+_LOCAL_CACHE_TYPES = frozenset({bytes, str, int, float, bool, frozenset})
+
+
+def _parse_server(server: str) -> Tuple[str, int]:
+    """Split a 'host:port' string into a (host, port) tuple."""
+    host, _, port = server.strip().partition(':')
+    return host, int(port or 11211)
+
+
+@lru_cache(maxsize=4096)
+def _hash_key(key: bytes) -> str:
+    """Return a short digest for keys that cannot be used verbatim."""
+    return hashlib.blake2b(key, digest_size=16).hexdigest()
+
+
+class ValueSerde:
+    """
+    Memcached value codec that only pickles complex objects.
+
+    bytes, str and int values are stored raw with their own flag so the hot
+    path skips pickle entirely. Flags match pymemcache's layout, so entries
+    stay readable by any pymemcache client using the default serde.
+    """
+
+    def serialize(self, key: str, value: Any) -> Tuple[bytes, int]:
+        """Encode a value and return it with its type flag."""
+        value_type = type(value)
+        if value_type is bytes:
+            return value, serde.FLAG_BYTES
+        if value_type is str:
+            return value.encode('utf-8'), serde.FLAG_TEXT
+        if value_type is int:
+            return b'%d' % value, serde.FLAG_INTEGER
+        return pickle.dumps(value, pickle.HIGHEST_PROTOCOL), serde.FLAG_PICKLE
+
+    def deserialize(self, key: str, value: bytes, flags: int) -> Any:
+        """Decode a value using its type flag."""
+        if flags == serde.FLAG_BYTES:
+            return value
+        if flags & serde.FLAG_TEXT:
+            return value.decode('utf-8')
+        if flags & (serde.FLAG_INTEGER | serde.FLAG_LONG):
+            return int(value)
+        if flags & serde.FLAG_PICKLE:
+            try:
+                return pickle.loads(value)
+            except Exception:
+                logger.warning("Failed to unpickle cached value", exc_info=True)
+                return None
+        return value
+
+
+class PylibmcClient:
+    """
+    pylibmc (libmemcached) driver exposing the pymemcache calls MemcachedClient uses.
+
+    pylibmc clients are not thread-safe, so each thread reserves its own
+    connection from a ThreadMappedPool. Values are serialized by pylibmc,
+    whose flags differ from pymemcache's: do not mix drivers on one namespace.
+    """
+
+    def __init__(self, servers: List[str], behaviors: Dict[str, Any]):
+        """
+        Initialize the pylibmc client.
+
+        Args:
+            servers: List of memcached servers in format 'host:port'
+            behaviors: libmemcached behaviors
+        """
+        self._master = pylibmc.Client([server.strip() for server in servers], binary=True,
+                                      behaviors=behaviors)
+        self._pool = pylibmc.ThreadMappedPool(self._master)
+
+    def get(self, key: str) -> Any:
+        """Get a single value."""
+        with self._pool.reserve() as mc:
+            return mc.get(key)
+
+    def set(self, key: str, value: Any, expire: int = 0) -> bool:
+        """Set a single value."""
+        with self._pool.reserve() as mc:
+            return mc.set(key, value, time=expire)
+
+    def delete(self, key: str) -> bool:
+        """Delete a single value."""
+        with self._pool.reserve() as mc:
+            return mc.delete(key)
+
+    def incr(self, key: str, value: int = 1) -> Optional[int]:
+        """Increment a counter; None if the key does not exist."""
+        with self._pool.reserve() as mc:
+            try:
+                return mc.incr(key, value)
+            except pylibmc.NotFound:
+                return None
+
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """Get several values in one round trip."""
+        with self._pool.reserve() as mc:
+            return mc.get_multi(keys)
+
+    def set_many(self, values: Dict[str, Any], expire: int = 0) -> List[str]:
+        """Set several values and return the keys that failed."""
+        with self._pool.reserve() as mc:
+            return mc.set_multi(values, time=expire)
+
+    def delete_many(self, keys: List[str]) -> bool:
+        """Delete several values in one round trip."""
+        with self._pool.reserve() as mc:
+            return mc.delete_multi(keys)
+
+    def flush_all(self) -> bool:
+        """Flush every server."""
+        with self._pool.reserve() as mc:
+            return mc.flush_all()
+
+    def stats(self) -> Dict[str, Dict[str, Union[int, str]]]:
+        """Return statistics keyed by server."""
+        with self._pool.reserve() as mc:
+            return {server.split(' ')[0]: values for server, values in mc.get_stats()}
 
 
 class MemcachedClient:
@@ -22,8 +161,11 @@ class MemcachedClient:
     Memcached client wrapper with additional functionality.
 
     Features:
-    - Connection pooling
+    - Connection pooling shared across threads
+    - pymemcache or pylibmc (libmemcached) driver
+    - Consistent hashing across multiple servers
     - Automatic key namespacing
+    - In-process TTL micro-cache for hot keys
     - Timeout handling
     - Serialization handling
     - Logging and monitoring
@@ -36,11 +178,34 @@ class MemcachedClient:
         Args:
             servers: List of memcached servers in format 'host:port'
             namespace: Namespace prefix for all keys
-            **kwargs: Additional arguments for memcache.Client
+            **kwargs: Additional arguments for the pymemcache client, or
+                ``behaviors`` for pylibmc
         """
         self.namespace = namespace
+        self._max_raw_key_length = MEMCACHED_MAX_KEY_LENGTH - len(namespace) - 1
         self.default_timeout = int(os.environ.get('CACHE_DEFAULT_TIMEOUT', '300'))
-        self.client = memcache.Client(servers, **kwargs)
+        self.servers = servers
+
+        # Short-lived per-process cache in front of memcached; 0 disables it
+        local_ttl = float(os.environ.get('LOCAL_CACHE_TTL', '5'))
+        self._local: Optional[TTLCache] = None
+        self._local_lock = threading.Lock()
+        if local_ttl > 0:
+            self._local = TTLCache(maxsize=int(os.environ.get('LOCAL_CACHE_MAXSIZE', '1024')), ttl=local_ttl)
+
+        if 'behaviors' in kwargs:
+            self.client = PylibmcClient(servers, kwargs['behaviors'])
+            logger.info(f"Initialized pylibmc Memcached client with servers: {servers}")
+            return
+
+        kwargs.setdefault('serde', ValueSerde())
+        kwargs.setdefault('default_noreply', False)
+
+        addresses = [_parse_server(server) for server in servers]
+        if len(addresses) == 1:
+            self.client = PooledClient(addresses[0], **kwargs)
+        else:
+            self.client = HashClient(addresses, use_pooling=True, **kwargs)
         logger.info(f"Initialized Memcached client with servers: {servers}")
 
     def _make_key(self, key: str) -> str:
@@ -53,9 +218,13 @@ class MemcachedClient:
         Returns:
             Namespaced cache key
         """
-        if isinstance(key, str):
-            key = key.encode('utf-8')
-        return f"{self.namespace}:{hashlib.sha256(key).hexdigest()}"
+        safe = key.encode('utf-8') if isinstance(key, str) else key
+        if (len(safe) <= self._max_raw_key_length and not safe.startswith(b'h:')
+                and not _MEMCACHED_BAD_CHARS.search(safe)):
+            return f"{self.namespace}:{safe.decode('ascii')}"
+
+        # Hash only keys that are too long or contain illegal characters
+        return f"{self.namespace}:h:{_hash_key(safe)}"
 
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -69,12 +238,20 @@ class MemcachedClient:
             Cached value or default
         """
         namespaced_key = self._make_key(key)
+        if self._local is not None:
+            with self._local_lock:
+                value = self._local.get(namespaced_key)
+            if value is not None:
+                return value
+
         value = self.client.get(namespaced_key)
         if value is None:
-            logger.debug(f"Cache miss for key: {key}")
+            logger.debug("Cache miss for key: %s", key)
             return default
 
-        logger.debug(f"Cache hit for key: {key}")
+        self._set_local(namespaced_key, value)
+
+        logger.debug("Cache hit for key: %s", key)
         return value
 
     def set(self, key: str, value: Any, timeout: Optional[int] = None) -> bool:
@@ -93,11 +270,13 @@ class MemcachedClient:
         if timeout is None:
             timeout = self.default_timeout
 
-        result = self.client.set(namespaced_key, value, timeout)
+        self._invalidate_local(namespaced_key)
+
+        result = self.client.set(namespaced_key, value, expire=timeout)
         if result:
-            logger.debug(f"Cache set for key: {key} with timeout: {timeout}s")
+            logger.debug("Cache set for key: %s with timeout: %ss", key, timeout)
         else:
-            logger.warning(f"Failed to set cache for key: {key}")
+            logger.warning("Failed to set cache for key: %s", key)
 
         return result
 
@@ -112,12 +291,110 @@ class MemcachedClient:
             True if successful, False otherwise
         """
         namespaced_key = self._make_key(key)
+        self._invalidate_local(namespaced_key)
         result = self.client.delete(namespaced_key)
         if result:
-            logger.debug(f"Cache deleted for key: {key}")
+            logger.debug("Cache deleted for key: %s", key)
         else:
-            logger.warning(f"Failed to delete cache for key: {key}")
+            logger.warning("Failed to delete cache for key: %s", key)
+
+        return result
+
+    def incr(self, key: str, delta: int = 1) -> Optional[int]:
+        """
+        Atomically increment an integer value.
+
+        Args:
+            key: Cache key
+            delta: Amount to add
+
+        Returns:
+            New value, or None if the key does not exist
+        """
+        namespaced_key = self._make_key(key)
+        self._invalidate_local(namespaced_key)
+        result = self.client.incr(namespaced_key, delta)
+        if result is None:
+            logger.debug("Cache incr missed key: %s", key)
+        return result
+
+    def get_many(self, keys: List[str], use_local: bool = True) -> Dict[str, Any]:
+        """
+        Get several values from cache in one round trip.
+
+        Args:
+            keys: Cache keys
+            use_local: Whether the in-process cache may answer; pass False
+                for values other processes change, such as revision counters
+
+        Returns:
+            Dictionary of found values keyed by original key
+        """
+        found: Dict[str, Any] = {}
+        pending: Dict[str, str] = {}
+        for key in keys:
+            namespaced_key = self._make_key(key)
+            value = None
+            if use_local and self._local is not None:
+                with self._local_lock:
+                    value = self._local.get(namespaced_key)
+            if value is not None:
+                found[key] = value
+            else:
+                pending[namespaced_key] = key
+
+        if pending:
+            values = self.client.get_many(list(pending))
+            for namespaced_key, value in values.items():
+                if value is None:
+                    continue
+                found[pending[namespaced_key]] = value
+                if use_local:
+                    self._set_local(namespaced_key, value)
+
+        logger.debug("Cache get_many: %d/%d hits", len(found), len(keys))
+        return found
+
+    def set_many(self, mapping: Dict[str, Any], timeout: Optional[int] = None) -> bool:
+        """
+        Set several values in cache in one round trip.
+
+        Args:
+            mapping: Values keyed by cache key
+            timeout: Cache timeout in seconds (0 = no expiration)
+
+        Returns:
+            True if all values were stored, False otherwise
+        """
+        if timeout is None:
+            timeout = self.default_timeout
+
+        values = {self._make_key(key): value for key, value in mapping.items()}
+        for namespaced_key in values:
+            self._invalidate_local(namespaced_key)
+
+        failed = self.client.set_many(values, expire=timeout)
+        if failed:
+            logger.warning("Failed to set %d of %d cache keys", len(failed), len(values))
+
+        return not failed
+
+    def delete_many(self, keys: List[str]) -> bool:
+        """
+        Delete several values from cache in one round trip.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            True if successful, False otherwise
+        """
+        namespaced_keys = [self._make_key(key) for key in keys]
+        for namespaced_key in namespaced_keys:
+            self._invalidate_local(namespaced_key)
 
+        result = self.client.delete_many(namespaced_keys)
+        logger.debug("Cache delete_many for %d keys", len(namespaced_keys))
         return result
 
     def clear(self) -> bool:
@@ -127,10 +404,26 @@ class MemcachedClient:
         Returns:
             True if successful, False otherwise
         """
+        if self._local is not None:
+            with self._local_lock:
+                self._local.clear()
+
         result = self.client.flush_all()
         logger.info("Cache cleared")
         return result
 
+    def _set_local(self, namespaced_key: str, value: Any) -> None:
+        """Keep an immutable value in the in-process cache."""
+        if self._local is not None and type(value) in _LOCAL_CACHE_TYPES:
+            with self._local_lock:
+                self._local[namespaced_key] = value
+
+    def _invalidate_local(self, namespaced_key: str) -> None:
+        """Drop a key from the in-process cache."""
+        if self._local is not None:
+            with self._local_lock:
+                self._local.pop(namespaced_key, None)
+
     def stats(self) -> Dict[str, Dict[str, Union[int, str]]]:
         """
         Get cache statistics.
@@ -138,29 +431,59 @@ class MemcachedClient:
         Returns:
             Dictionary of server statistics
         """
-        return self.client.get_stats()
+        if isinstance(self.client, PylibmcClient):
+            return self.client.stats()
+        if isinstance(self.client, HashClient):
+            return {name: client.stats() for name, client in self.client.clients.items()}
+        return {self.servers[0]: self.client.stats()}
 
 
 def get_memcached_client() -> MemcachedClient:
     """
-    Get or create a thread-local Memcached client.
+    Get or create the process-wide Memcached client.
 
     Returns:
         MemcachedClient instance
     """
-    if not hasattr(_thread_locals, 'memcached_client'):
-        servers = os.environ.get('MEMCACHED_SERVERS', 'memcached:11211').split(',')
-        namespace = os.environ.get('MEMCACHED_NAMESPACE', 'app')
-
-        _thread_locals.memcached_client = MemcachedClient(
-            servers=servers,
-            namespace=namespace,
-            dead_retry=int(os.environ.get('MEMCACHED_DEAD_RETRY', '60')),
-            socket_timeout=float(os.environ.get('MEMCACHED_SOCKET_TIMEOUT', '3.0')),
-            retries=int(os.environ.get('MEMCACHED_RETRIES', '2')),
-        )
-
-    return _thread_locals.memcached_client
+    global _memcached_client
+    if _memcached_client is None:
+        with _memcached_client_lock:
+            if _memcached_client is None:
+                servers = os.environ.get('MEMCACHED_SERVERS', 'memcached:11211').split(',')
+                namespace = os.environ.get('MEMCACHED_NAMESPACE', 'app')
+                driver = os.environ.get('MEMCACHED_DRIVER', 'pylibmc')
+                if pylibmc is not None and driver == 'pylibmc':
+                    socket_timeout = float(os.environ.get('MEMCACHED_SOCKET_TIMEOUT', '3.0'))
+                    connect_timeout = float(os.environ.get('MEMCACHED_CONNECT_TIMEOUT', '1.0'))
+                    dead_retry = int(os.environ.get('MEMCACHED_DEAD_RETRY', '60'))
+                    behaviors = {
+                        'tcp_nodelay': True,
+                        'ketama': True,
+                        'no_block': True,
+                        '_poll_timeout': int(socket_timeout * 1000),
+                        'connect_timeout': int(connect_timeout * 1000),
+                        'dead_timeout': dead_retry,
+                        'retry_timeout': dead_retry,
+                    }
+                    _memcached_client = MemcachedClient(servers=servers, namespace=namespace,
+                                                        behaviors=behaviors)
+                    return _memcached_client
+
+                options = {
+                    'connect_timeout': float(os.environ.get('MEMCACHED_CONNECT_TIMEOUT', '1.0')),
+                    'timeout': float(os.environ.get('MEMCACHED_SOCKET_TIMEOUT', '3.0')),
+                    'max_pool_size': int(os.environ.get('MEMCACHED_MAX_POOL_SIZE', '16')),
+                    'no_delay': True,
+                }
+                if len(servers) > 1:
+                    options.update(
+                        dead_timeout=int(os.environ.get('MEMCACHED_DEAD_RETRY', '60')),
+                        retry_attempts=int(os.environ.get('MEMCACHED_RETRIES', '2')),
+                    )
+
+                _memcached_client = MemcachedClient(servers=servers, namespace=namespace, **options)
+
+    return _memcached_client
 
 
 # Helper functions for common cache operations
@@ -207,6 +530,135 @@ def cache_delete(key: str) -> bool:
     return get_memcached_client().delete(key)
 
 
+def cache_incr(key: str, delta: int = 1) -> Optional[int]:
+    """
+    Atomically increment an integer value in cache.
+
+    Args:
+        key: Cache key
+        delta: Amount to add
+
+    Returns:
+        New value, or None if the key does not exist
+    """
+    return get_memcached_client().incr(key, delta)
+
+
+def cache_delete_many(keys: List[str]) -> bool:
+    """
+    Delete several values from cache in one round trip.
+
+    Args:
+        keys: Cache keys
+
+    Returns:
+        True if successful, False otherwise
+    """
+    return get_memcached_client().delete_many(keys)
+
+
+def cache_get_many(keys: List[str], use_local: bool = True) -> Dict[str, Any]:
+    """
+    Get several values from cache in one round trip.
+
+    Args:
+        keys: Cache keys
+        use_local: Whether the in-process cache may answer
+
+    Returns:
+        Dictionary of found values keyed by cache key
+    """
+    return get_memcached_client().get_many(keys, use_local=use_local)
+
+
+def cache_set_many(mapping: Dict[str, Any], timeout: Optional[int] = None) -> bool:
+    """
+    Set several values in cache in one round trip.
+
+    Args:
+        mapping: Values keyed by cache key
+        timeout: Cache timeout in seconds
+
+    Returns:
+        True if all values were stored, False otherwise
+    """
+    return get_memcached_client().set_many(mapping, timeout)
+
+
+class CachedValue:
+    """Placeholder for a value fetched when its CacheBatch exits."""
+
+    __slots__ = ('key', 'default', 'value', 'resolved')
+
+    def __init__(self, key: str, default: Any = None):
+        """
+        Initialize the placeholder.
+
+        Args:
+            key: Cache key
+            default: Value used if the key is not found
+        """
+        self.key = key
+        self.default = default
+        self.value = default
+        self.resolved = False
+
+
+class CacheBatch:
+    """
+    Context manager that coalesces cache reads into a single get_many.
+
+    Usage:
+        with cache_batch() as batch:
+            user = batch.get('user:1')
+            roles = batch.get('roles:1')
+        use(user.value, roles.value)
+    """
+
+    def __init__(self):
+        """Initialize an empty batch."""
+        self._pending: Dict[str, List[CachedValue]] = {}
+
+    def get(self, key: str, default: Any = None) -> CachedValue:
+        """
+        Register a read to be issued when the batch exits.
+
+        Args:
+            key: Cache key
+            default: Value used if the key is not found
+
+        Returns:
+            Placeholder resolved on batch exit
+        """
+        placeholder = CachedValue(key, default)
+        self._pending.setdefault(key, []).append(placeholder)
+        return placeholder
+
+    def __enter__(self) -> 'CacheBatch':
+        """Enter the batch."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Issue all registered reads in one round trip."""
+        if exc_type is None and self._pending:
+            values = cache_get_many(list(self._pending))
+            for key, placeholders in self._pending.items():
+                for placeholder in placeholders:
+                    placeholder.value = values.get(key, placeholder.default)
+                    placeholder.resolved = True
+        self._pending.clear()
+
+
+def cache_batch() -> CacheBatch:
+    """
+    Start a batch of coalesced cache reads.
+
+    Returns:
+        CacheBatch context manager
+    """
+    return CacheBatch()
+
+
 def cached(timeout: Optional[int] = None):
     """
     Decorate function to cache function results.
@@ -218,12 +670,18 @@ def cached(timeout: Optional[int] = None):
         Decorated function
     """
     def decorator(func):
+        prefix = f"{func.__module__}.{func.__qualname__}:"
+
+        @wraps(func)
         def wrapper(*args, **kwargs):
-            # Create a cache key from function name and arguments
-            key_parts = [func.__name__]
-            key_parts.extend([str(arg) for arg in args])
-            key_parts.extend([f"{k}:{v}" for k, v in sorted(kwargs.items())])
-            key = ":".join(key_parts)
+            # Create a cache key from function name and arguments. kwargs are
+            # sorted so keys agree across processes; frozenset order would not
+            if not kwargs:
+                key = prefix + repr(args)
+            elif len(kwargs) == 1:
+                key = prefix + repr((args, tuple(kwargs.items())))
+            else:
+                key = prefix + repr((args, tuple(sorted(kwargs.items()))))
 
             # Try to get from cache first
             cached_value = cache_get(key)
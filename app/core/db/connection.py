@@ -6,11 +6,13 @@ Last updated: 2025-08-30 22:40:55 UTC by nullroute-commits
 """
 import os
 import logging
-from typing import Any, Dict, Optional
-from sqlalchemy import create_engine, MetaData, event
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+from sqlalchemy import create_engine, MetaData, event, text
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import QueuePool
+from sqlalchemy.orm import scoped_session, sessionmaker, Session, SessionTransaction
+from sqlalchemy.pool import NullPool, QueuePool
 from sqlalchemy.engine import Engine
 
 logger = logging.getLogger(__name__)
@@ -21,9 +23,73 @@ Base = declarative_base()
 # Metadata for reflection and migrations
 metadata = MetaData()
 
+# Health-check statement, compiled once and reused from the Core statement cache
+_SELECT_ONE = text("SELECT 1")
+
 # Global engine and session factory
 _engine: Optional[Engine] = None
-_SessionLocal: Optional[sessionmaker] = None
+_SessionLocal: Optional[scoped_session] = None
+
+
+class ReentrantSession(Session):
+    """
+    Session that stays open until the outermost ``with`` block exits.
+
+    get_db_session() hands every caller on a thread the same registered
+    session, so a nested block (e.g. an RBAC check inside an audit query)
+    must not close it under the caller.
+
+    Each nested block runs in a SAVEPOINT. Its commit() only releases the
+    savepoint and its rollback() or an exception only undoes its own work;
+    the outermost block still owns the transaction. The SAVEPOINT is only
+    emitted if the nested block actually uses the connection.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Initialize the session with no open blocks."""
+        super().__init__(*args, **kwargs)
+        self._depth = 0
+        self._savepoints: List[SessionTransaction] = []
+
+    def __enter__(self) -> 'ReentrantSession':
+        """Enter a block using the session."""
+        self._depth += 1
+        if self._depth > 1:
+            # begin_nested() flushes first, so the caller's pending objects
+            # belong to the outer transaction rather than this block
+            self._savepoints.append(self.begin_nested())
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Release or roll back a nested block; close the session when the outermost exits."""
+        if self._depth > 1:
+            savepoint = self._savepoints.pop()
+            if savepoint is self.get_nested_transaction():
+                if exc_type is None:
+                    savepoint.commit()
+                else:
+                    savepoint.rollback()
+        self._depth -= 1
+        if self._depth == 0:
+            self.close()
+
+    def commit(self) -> None:
+        """Commit the transaction, or only release the savepoint in a nested block."""
+        if not self._savepoints:
+            super().commit()
+            return
+        self._savepoints.pop().commit()
+        self._savepoints.append(self.begin_nested())
+
+    def rollback(self) -> None:
+        """Roll back the transaction, or only the savepoint in a nested block."""
+        if not self._savepoints:
+            super().rollback()
+            return
+        savepoint = self._savepoints.pop()
+        if savepoint is self.get_nested_transaction():
+            savepoint.rollback()
+        self._savepoints.append(self.begin_nested())
 
 
 class DatabaseConnection:
@@ -47,14 +113,17 @@ class DatabaseConnection:
             **kwargs: Additional engine parameters
         """
         self.database_url = database_url or self._build_database_url()
+        # Host/port/database only; credentials are stripped once here
+        self._safe_url = self.database_url.rsplit('@', 1)[-1]
+        self._connected_info = {'status': 'connected', 'url': self._safe_url}
+        self.statement_cache_size = int(os.environ.get('DB_STATEMENT_CACHE_SIZE', '100'))
+        # Behind a transaction-pooling PgBouncer pooling happens outside the process
+        self.pgbouncer = os.environ.get('DB_PGBOUNCER', 'False').lower() == 'true'
         self.engine_params = {
-            'poolclass': QueuePool,
-            'pool_size': int(os.environ.get('DB_POOL_SIZE', '10')),
-            'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW', '20')),
-            'pool_timeout': int(os.environ.get('DB_POOL_TIMEOUT', '30')),
-            'pool_recycle': int(os.environ.get('DB_POOL_RECYCLE', '3600')),
-            'pool_pre_ping': True,
+            **self._build_pool_params(),
             'echo': os.environ.get('DB_ECHO', 'False').lower() == 'true',
+            'query_cache_size': int(os.environ.get('DB_QUERY_CACHE_SIZE', '1200')),
+            'connect_args': self._build_connect_args(),
             **kwargs
         }
         self.engine = None
@@ -73,7 +142,52 @@ class DatabaseConnection:
         port = os.environ.get('POSTGRES_PORT', '5432')
         database = os.environ.get('POSTGRES_DB', 'django_app')
 
-        return f"postgresql://{user}:{password}@{host}:{port}/{database}"
+        return f"postgresql+psycopg://{user}:{password}@{host}:{port}/{database}"
+
+    def _build_pool_params(self) -> Dict[str, Any]:
+        """
+        Build connection pool parameters.
+
+        With DB_PGBOUNCER=true every checkout opens a fresh connection to
+        PgBouncer (NullPool), so there is no in-process pool lock or size cap.
+
+        Returns:
+            Pool keyword arguments for create_engine
+        """
+        if self.pgbouncer:
+            return {'poolclass': NullPool}
+
+        return {
+            'poolclass': QueuePool,
+            'pool_size': int(os.environ.get('DB_POOL_SIZE', '20')),
+            # -1 lets the pool overflow without limit
+            'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW', '20')),
+            'pool_timeout': int(os.environ.get('DB_POOL_TIMEOUT', '30')),
+            'pool_recycle': int(os.environ.get('DB_POOL_RECYCLE', '3600')),
+            'pool_pre_ping': os.environ.get('DB_POOL_PRE_PING', 'True').lower() == 'true',
+            # Reuse the most recently returned connection so a warm subset
+            # serves steady load and keeps its prepared statements
+            'pool_use_lifo': True,
+        }
+
+    def _build_connect_args(self) -> Dict[str, Any]:
+        """
+        Build driver connection arguments.
+
+        psycopg 3 prepares a statement server-side once it has run
+        DB_PREPARE_THRESHOLD times on a connection. Set DB_PGBOUNCER=true
+        behind a transaction-pooling PgBouncer, where prepared statements
+        do not survive between transactions.
+
+        Returns:
+            Keyword arguments passed to the DBAPI connect()
+        """
+        if not self.database_url.startswith('postgresql+psycopg:'):
+            return {}
+
+        if self.pgbouncer:
+            return {'prepare_threshold': None}
+        return {'prepare_threshold': int(os.environ.get('DB_PREPARE_THRESHOLD', '5'))}
 
     def connect(self) -> None:
         """
@@ -89,23 +203,68 @@ class DatabaseConnection:
             event.listen(self.engine, "connect", self._on_connect)
             event.listen(self.engine, "checkout", self._on_checkout)
 
-            # Test connection
-            with self.engine.connect() as conn:
-                conn.execute("SELECT 1")
-
-            # Create session factory
-            self.SessionLocal = sessionmaker(
+            # Create a thread-scoped session registry; each thread reuses one
+            # Session object instead of constructing a new one per call
+            self.SessionLocal = scoped_session(sessionmaker(
+                class_=ReentrantSession,
                 autocommit=False,
                 autoflush=False,
                 bind=self.engine
-            )
+            ))
 
-            logger.info(f"Connected to database: {self.database_url.split('@')[1]}")
+            logger.info(f"Connected to database: {self._safe_url}")
 
         except Exception as e:
             logger.error(f"Failed to connect to database: {str(e)}")
             raise
 
+    def warmup(self, connections: int = 1) -> int:
+        """
+        Open pool connections ahead of traffic.
+
+        Connections are checked out concurrently, so warming the pool costs
+        about one connection handshake rather than one per connection.
+
+        Args:
+            connections: Number of connections to open
+
+        Returns:
+            Number of connections opened successfully
+        """
+        if not self.engine:
+            self.connect()
+
+        if self.pgbouncer:
+            # NullPool closes every connection on release; nothing to keep warm
+            return 0
+
+        def open_connection(_):
+            try:
+                conn = self.engine.connect()
+            except Exception:
+                barrier.abort()
+                raise
+            with conn:
+                try:
+                    barrier.wait()
+                except threading.BrokenBarrierError:
+                    pass
+
+        # Hold every checkout until all are open so the pool cannot hand the
+        # same connection to several workers
+        barrier = threading.Barrier(connections, timeout=self.engine_params.get('pool_timeout', 30))
+        opened = 0
+        with ThreadPoolExecutor(max_workers=connections) as executor:
+            for future in [executor.submit(open_connection, i) for i in range(connections)]:
+                try:
+                    future.result()
+                    opened += 1
+                except Exception as e:
+                    logger.error(f"Failed to warm database connection: {str(e)}")
+
+        logger.info(f"Warmed {opened} database connections")
+        return opened
+
     def _on_connect(self, dbapi_connection, connection_record):
         """Handle new database connections."""
         logger.debug("New database connection established")
@@ -114,13 +273,21 @@ class DatabaseConnection:
         if hasattr(dbapi_connection, 'set_client_encoding'):
             dbapi_connection.set_client_encoding('utf8')
 
+        # Size psycopg 3's per-connection prepared statement cache
+        if hasattr(dbapi_connection, 'prepared_max'):
+            dbapi_connection.prepared_max = self.statement_cache_size
+
     def _on_checkout(self, dbapi_connection, connection_record, connection_proxy):
         """Handle connection checkout from pool."""
         logger.debug("Database connection checked out from pool")
 
     def get_session(self) -> Session:
         """
-        Get a new database session.
+        Get the database session for the current thread.
+
+        Leaving the outermost ``with`` block closes the session, which
+        releases its connection and identity map but keeps it registered
+        for reuse; nested blocks share it.
 
         Returns:
             SQLAlchemy session
@@ -130,6 +297,11 @@ class DatabaseConnection:
 
         return self.SessionLocal()
 
+    def remove_session(self) -> None:
+        """Close and discard the current thread's session."""
+        if self.SessionLocal:
+            self.SessionLocal.remove()
+
     def create_tables(self) -> None:
         """Create all tables defined in models."""
         if not self.engine:
@@ -158,7 +330,7 @@ class DatabaseConnection:
                 self.connect()
 
             with self.engine.connect() as conn:
-                result = conn.execute("SELECT 1")
+                result = conn.execute(_SELECT_ONE)
                 return result.scalar() == 1
 
         except Exception as e:
@@ -176,9 +348,11 @@ class DatabaseConnection:
             return {'status': 'disconnected'}
 
         pool = self.engine.pool
+        if isinstance(pool, NullPool):
+            return {**self._connected_info, 'pool': 'external'}
+
         return {
-            'status': 'connected',
-            'url': self.database_url.split('@')[1],  # Hide credentials
+            **self._connected_info,
             'pool_size': pool.size(),
             'checked_in': pool.checkedin(),
             'checked_out': pool.checkedout(),
@@ -187,6 +361,7 @@ class DatabaseConnection:
 
     def close(self) -> None:
         """Close database connection."""
+        self.remove_session()
         if self.engine:
             self.engine.dispose()
             logger.info("Closed database connection")
@@ -210,7 +385,7 @@ def get_db_connection() -> DatabaseConnection:
 
 def get_db_session() -> Session:
     """
-    Get a new database session.
+    Get the database session for the current thread.
 
     Returns:
         SQLAlchemy session
@@ -218,6 +393,11 @@ def get_db_session() -> Session:
     return get_db_connection().get_session()
 
 
+def remove_db_session() -> None:
+    """Discard the current thread's session, e.g. when a request or worker thread ends."""
+    db_connection.remove_session()
+
+
 def get_engine() -> Engine:
     """
     Get the SQLAlchemy engine.
@@ -252,7 +432,7 @@ class DatabaseSession:
 
     def __enter__(self) -> Session:
         """Enter context and return session."""
-        self.session = get_db_session()
+        self.session = get_db_session().__enter__()
         return self.session
 
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -263,7 +443,8 @@ class DatabaseSession:
             elif exc_type is not None:
                 self.session.rollback()
 
-            self.session.close()
+            # Only the outermost block closes the thread's session
+            self.session.__exit__(exc_type, exc_val, exc_tb)
 
 
 # Helper functions
@@ -279,7 +460,7 @@ def execute_raw_sql(sql: str, params: Optional[Dict] = None) -> Any:
         Query result
     """
     with DatabaseSession() as session:
-        return session.execute(sql, params or {}).fetchall()
+        return session.execute(text(sql), params or {}).fetchall()
 
 
 def health_check() -> bool:
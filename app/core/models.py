@@ -4,26 +4,51 @@ SQLAlchemy models for User, Role, Permission, and audit logging.
 
 Last updated: 2025-08-30 22:40:55 UTC by nullroute-commits
 """
+import os
+import time
 import uuid
 from datetime import datetime, timezone
-from sqlalchemy import Column, String, Integer, DateTime, Boolean, Text, ForeignKey, Table
-from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.orm import relationship
+from typing import Any, Dict, List
+from sqlalchemy import Column, String, Integer, DateTime, Boolean, Text, ForeignKey, Table, Index, event
+from sqlalchemy import func, literal, select, text
+from sqlalchemy.dialects.postgresql import UUID, JSONB, insert as pg_insert
+from sqlalchemy.orm import object_session, relationship
 from app.core.db.connection import Base
 
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUID (RFC 9562 version 7).
+
+    The 48-bit millisecond timestamp prefix makes new keys sort after
+    existing ones, so B-tree inserts append to the rightmost leaf page.
+
+    Returns:
+        UUID with version 7
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), 'big')
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return uuid.UUID(int=value)
+
+
 # Association tables for many-to-many relationships
+# The composite primary keys serve lookups by their leading column; the extra
+# indexes serve the reverse direction (Role.users, Permission.roles, FK checks)
 user_roles = Table(
     'user_roles',
     Base.metadata,
     Column('user_id', UUID(as_uuid=True), ForeignKey('users.id'), primary_key=True),
-    Column('role_id', UUID(as_uuid=True), ForeignKey('roles.id'), primary_key=True)
+    Column('role_id', UUID(as_uuid=True), ForeignKey('roles.id'), primary_key=True),
+    Index('ix_user_roles_role_id', 'role_id'),
 )
 
 role_permissions = Table(
     'role_permissions',
     Base.metadata,
     Column('role_id', UUID(as_uuid=True), ForeignKey('roles.id'), primary_key=True),
-    Column('permission_id', UUID(as_uuid=True), ForeignKey('permissions.id'), primary_key=True)
+    Column('permission_id', UUID(as_uuid=True), ForeignKey('permissions.id'), primary_key=True),
+    Index('ix_role_permissions_permission_id', 'permission_id'),
 )
 
 
@@ -32,28 +57,61 @@ class BaseModel(Base):
 
     __abstract__ = True
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
-    updated_at = Column(
-        DateTime(
-            timezone=True), default=lambda: datetime.now(
-            timezone.utc), onupdate=lambda: datetime.now(
-                timezone.utc))
+    # Time-ordered keys from the ORM; PostgreSQL 17 has no uuidv7(), so rows
+    # inserted outside the ORM fall back to gen_random_uuid()
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7,
+                server_default=text('gen_random_uuid()'))
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     created_by = Column(UUID(as_uuid=True), ForeignKey('users.id'), nullable=True)
     updated_by = Column(UUID(as_uuid=True), ForeignKey('users.id'), nullable=True)
 
     def to_dict(self):
         """Convert model instance to dictionary."""
-        return {column.name: getattr(self, column.name) for column in self.__table__.columns}
+        to_dict = type(self).__dict__.get('_to_dict') or type(self)._build_to_dict()
+        return to_dict(self)
+
+    @classmethod
+    def _build_to_dict(cls):
+        """
+        Generate and cache a to_dict implementation for this class.
+
+        The generated function reads each column attribute directly instead of
+        walking the table's columns on every call.
+
+        Returns:
+            Function mapping an instance to a dict keyed by column name
+        """
+        mapper = cls.__mapper__
+        fields = tuple(
+            (column.name, mapper.get_property_by_column(column).key)
+            for column in cls.__table__.columns
+        )
+        body = ', '.join(f'{name!r}: self.{key}' for name, key in fields)
+        namespace: dict = {}
+        exec(f'def _to_dict(self):\n    return {{{body}}}\n', namespace)
+
+        cls.__column_names__ = tuple(name for name, _ in fields)
+        cls._to_dict = namespace['_to_dict']
+        return cls._to_dict
 
 
 class User(BaseModel):
     """User model for authentication and RBAC."""
 
     __tablename__ = 'users'
-
-    username = Column(String(150), unique=True, nullable=False, index=True)
-    email = Column(String(254), unique=True, nullable=False, index=True)
+    __table_args__ = (
+        # Authentication looks up active users only; covering id and
+        # password_hash lets those lookups be index-only scans
+        Index('ix_users_username_active', 'username', postgresql_where=text('is_active'),
+              postgresql_include=['id', 'password_hash']),
+        Index('ix_users_email_active', 'email', postgresql_where=text('is_active'),
+              postgresql_include=['id', 'password_hash']),
+    )
+
+    # Unique across inactive users too; the constraint's index serves other lookups
+    username = Column(String(150), unique=True, nullable=False)
+    email = Column(String(254), unique=True, nullable=False)
     first_name = Column(String(150), nullable=False)
     last_name = Column(String(150), nullable=False)
     password_hash = Column(String(128), nullable=False)
@@ -61,7 +119,7 @@ class User(BaseModel):
     is_staff = Column(Boolean, default=False, nullable=False)
     is_superuser = Column(Boolean, default=False, nullable=False)
     last_login = Column(DateTime(timezone=True), nullable=True)
-    date_joined = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+    date_joined = Column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
     roles = relationship('Role', secondary=user_roles, back_populates='users')
@@ -89,12 +147,68 @@ class User(BaseModel):
         if self.is_superuser:
             return True
 
-        for role in self.roles:
-            if role.is_active and any(perm.name == permission_name and perm.is_active
-                                      for perm in role.permissions):
-                return True
+        return permission_name in self.permission_names
+
+    @property
+    def permission_names(self) -> frozenset:
+        """
+        Names of the active permissions granted through active roles.
+
+        Built from the roles and permissions already loaded on the instance,
+        otherwise with a single joined query. Not cached on the instance, so role changes are
+        seen on the next call. Superuser status is not taken into account.
+
+        Returns:
+            Frozen set of permission names
+        """
+        session = object_session(self)
+        loaded = 'roles' in self.__dict__ and all('permissions' in role.__dict__
+                                                  for role in self.roles)
+        if not loaded and session is not None and self.id is not None:
+            return frozenset(session.execute(
+                select(Permission.name)
+                .join(role_permissions, role_permissions.c.permission_id == Permission.id)
+                .join(Role, Role.id == role_permissions.c.role_id)
+                .join(user_roles, user_roles.c.role_id == Role.id)
+                .where(user_roles.c.user_id == self.id,
+                       Role.is_active.is_(True),
+                       Permission.is_active.is_(True))
+                .distinct()
+            ).scalars())
+
+        return frozenset(perm.name for role in self.roles if role.is_active
+                         for perm in role.permissions if perm.is_active)
+
+    @classmethod
+    def check_permission(cls, session, user_id, permission_name: str) -> bool:
+        """
+        Check a role-granted permission with a single query.
+
+        Superuser status is not taken into account.
+
+        Args:
+            session: Database session
+            user_id: User UUID
+            permission_name: Name of the permission to check
 
-        return False
+        Returns:
+            True if an active role of the user grants the active permission
+        """
+        stmt = (
+            select(literal(1))
+            .select_from(
+                user_roles
+                .join(Role, Role.id == user_roles.c.role_id)
+                .join(role_permissions, role_permissions.c.role_id == user_roles.c.role_id)
+                .join(Permission, Permission.id == role_permissions.c.permission_id)
+            )
+            .where(user_roles.c.user_id == user_id,
+                   Permission.name == permission_name,
+                   Permission.is_active.is_(True),
+                   Role.is_active.is_(True))
+            .limit(1)
+        )
+        return session.execute(stmt).first() is not None
 
     def has_role(self, role_name: str) -> bool:
         """
@@ -132,6 +246,9 @@ class Permission(BaseModel):
     """Permission model for RBAC."""
 
     __tablename__ = 'permissions'
+    __table_args__ = (
+        Index('ix_perm_resource_action', 'resource', 'action', 'is_active'),
+    )
 
     name = Column(String(100), unique=True, nullable=False, index=True)
     description = Column(Text, nullable=True)
@@ -148,10 +265,36 @@ class Permission(BaseModel):
         return f'<Permission(name={self.name}, resource={self.resource}, action={self.action})>'
 
 
+# GIN indexes for containment (@>) queries on audit payloads. They slow down
+# audit writes, so they are only declared when AUDIT_JSONB_INDEXES is enabled.
+_AUDIT_JSONB_INDEXES = tuple(
+    Index(f'ix_audit_{column}_gin', column, postgresql_using='gin',
+          postgresql_ops={column: 'jsonb_path_ops'})
+    for column in ('old_values', 'new_values', 'request_data')
+) if os.environ.get('AUDIT_JSONB_INDEXES', 'False').lower() == 'true' else ()
+
+
 class AuditLog(BaseModel):
     """Audit log model for tracking all system activities."""
 
     __tablename__ = 'audit_logs'
+    __table_args__ = (
+        # Serve get_user_activity / get_resource_history filters and ordering
+        Index('ix_audit_user_created', 'user_id', 'created_at'),
+        Index('ix_audit_resource', 'resource_type', 'resource_id', 'created_at'),
+        *_AUDIT_JSONB_INDEXES,
+        # Monthly range partitions keep per-partition indexes small and allow pruning
+        {'postgresql_partition_by': 'RANGE (created_at)'},
+    )
+
+    # Never fetch server-generated values back after an insert; audit rows are
+    # write-only, so ORM inserts batch without RETURNING
+    __mapper_args__ = {'eager_defaults': False}
+
+    # PostgreSQL requires the partition key to be part of the primary key. The
+    # client-side default lets the ORM know the full key without RETURNING.
+    created_at = Column(DateTime(timezone=True), primary_key=True,
+                        default=lambda: datetime.now(timezone.utc), server_default=func.now())
 
     user_id = Column(UUID(as_uuid=True), ForeignKey('users.id'), nullable=True)
     session_id = Column(String(40), nullable=True)
@@ -176,8 +319,9 @@ class AuditLog(BaseModel):
     # Response details
     response_status = Column(Integer, nullable=True)    # HTTP status code
 
-    # Additional metadata
-    metadata = Column(JSONB, nullable=True)
+    # Additional metadata; the attribute is renamed because declarative
+    # classes reserve `metadata` for the MetaData collection
+    extra_metadata = Column('metadata', JSONB, nullable=True)
     message = Column(Text, nullable=True)
 
     # Relationships
@@ -188,6 +332,115 @@ class AuditLog(BaseModel):
         return f'<AuditLog(action={self.action}, resource_type={self.resource_type}, user_id={self.user_id})>'
 
 
+def bulk_insert_audit(session, rows: List[Dict[str, Any]]) -> None:
+    """
+    Insert audit rows with a single executemany.
+
+    Args:
+        session: Database session
+        rows: Rows keyed by column name (``metadata``, not ``extra_metadata``)
+    """
+    if session.get_bind().dialect.name == 'postgresql':
+        # Retried batches must not fail on rows that were already written
+        stmt = pg_insert(AuditLog.__table__).on_conflict_do_nothing()
+    else:
+        stmt = AuditLog.__table__.insert()
+    session.execute(stmt, rows)
+
+
+# Catch-all partition so inserts succeed if a monthly partition is missing
+AUDIT_DEFAULT_PARTITION = f'{AuditLog.__tablename__}_default'
+
+# Future months pre-created alongside the current one
+AUDIT_PARTITION_MONTHS_AHEAD = 2
+
+
+def month_start(moment: datetime, offset: int = 0) -> datetime:
+    """
+    Get the first instant of a month relative to a moment.
+
+    Args:
+        moment: Reference time
+        offset: Number of months to move forward (negative for backward)
+
+    Returns:
+        Midnight UTC on the first day of the month
+    """
+    index = moment.year * 12 + moment.month - 1 + offset
+    return datetime(index // 12, index % 12 + 1, 1, tzinfo=timezone.utc)
+
+
+def create_audit_partitions(connection, months_ahead: int = AUDIT_PARTITION_MONTHS_AHEAD) -> List[str]:
+    """
+    Create monthly audit_logs partitions from the current month onwards.
+
+    PostgreSQL refuses to create a partition whose range already has rows
+    in the default partition. When that happens the default is detached,
+    the new partitions are created, the misplaced rows are moved into them
+    and the default is attached again, all in the caller's transaction.
+
+    Args:
+        connection: Connection to run the DDL on
+        months_ahead: Number of future months to pre-create
+
+    Returns:
+        Names of the partitions ensured
+    """
+    table = AuditLog.__tablename__
+    default = AUDIT_DEFAULT_PARTITION
+    now = datetime.now(timezone.utc)
+    months = [
+        (f"{table}_{month_start(now, offset):%Y_%m}",
+         month_start(now, offset), month_start(now, offset + 1))
+        for offset in range(months_ahead + 1)
+    ]
+
+    missing = [
+        month for month in months
+        if connection.execute(text("SELECT to_regclass(:name)"), {'name': month[0]}).scalar() is None
+    ]
+    misplaced = [
+        month for month in missing
+        if connection.execute(text(
+            f"SELECT EXISTS (SELECT 1 FROM {default} "
+            f"WHERE created_at >= :start AND created_at < :end)"
+        ), {'start': month[1], 'end': month[2]}).scalar()
+    ]
+
+    if misplaced:
+        connection.execute(text(f"ALTER TABLE {table} DETACH PARTITION {default}"))
+    for name, start, end in missing:
+        connection.execute(text(
+            f"CREATE TABLE {name} PARTITION OF {table} "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        ))
+    for name, start, end in misplaced:
+        # Partitions share the parent's column order, so rows move as-is
+        connection.execute(text(
+            f"WITH moved AS (DELETE FROM {default} "
+            f"WHERE created_at >= :start AND created_at < :end RETURNING *) "
+            f"INSERT INTO {name} SELECT * FROM moved"
+        ), {'start': start, 'end': end})
+    if misplaced:
+        connection.execute(text(f"ALTER TABLE {table} ATTACH PARTITION {default} DEFAULT"))
+
+    return [name for name, _, _ in months]
+
+
+def _create_audit_partitions(target, connection, **kw) -> None:
+    """Create the default and upcoming monthly partitions with the audit_logs table."""
+    if connection.dialect.name != 'postgresql':
+        return
+    connection.execute(text(
+        f"CREATE TABLE IF NOT EXISTS {AUDIT_DEFAULT_PARTITION} "
+        f"PARTITION OF {AuditLog.__tablename__} DEFAULT"
+    ))
+    create_audit_partitions(connection)
+
+
+event.listen(AuditLog.__table__, 'after_create', _create_audit_partitions)
+
+
 class SystemConfiguration(BaseModel):
     """System configuration model for storing application settings."""
 
@@ -10,14 +10,55 @@ import time
 import logging
 import threading
 import pika
-from typing import Any, Callable
-from functools import wraps
+from typing import Any, Callable, Dict, Iterable, Set
+from functools import lru_cache, wraps
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional C serializer
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+
+def _dumps(message: Any) -> bytes:
+    """Serialize a message to JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(message).encode('utf-8')
+
+
+def _loads(body: bytes) -> Any:
+    """Deserialize a JSON message body."""
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
 # Thread local storage for RabbitMQ connections
 _thread_locals = threading.local()
 
+# Shared properties for the common publish case; pika only reads them
+_PERSISTENT_JSON_PROPS = pika.BasicProperties(delivery_mode=2, content_type='application/json')
+_TRANSIENT_JSON_PROPS = pika.BasicProperties(delivery_mode=1, content_type='application/json')
+
+
+def _message_properties(persistent: bool, include_timestamp: bool,
+                        properties: Dict[str, Any]) -> pika.BasicProperties:
+    """Return shared properties unless the caller overrides any."""
+    if not properties and not include_timestamp:
+        return _PERSISTENT_JSON_PROPS if persistent else _TRANSIENT_JSON_PROPS
+
+    props = {
+        'delivery_mode': 2 if persistent else 1,  # 2 for persistent
+        'content_type': 'application/json',
+    }
+    if include_timestamp:
+        props['timestamp'] = int(time.time())
+    # Update with user-provided properties
+    props.update(properties)
+    return pika.BasicProperties(**props)
+
 
 class RabbitMQClient:
     """
@@ -56,6 +97,11 @@ class RabbitMQClient:
         )
         self.connection = None
         self.channel = None
+        # Set by connect() and cleared when a publish finds the connection gone
+        self._alive = False
+        # Queues declared and bound on the current channel
+        self._declared: Set[str] = set()
+        self._bound: Set[str] = set()
         self.exchange = os.environ.get('RABBITMQ_EXCHANGE', 'app.topic')
         self.connect()
         logger.info(f"Initialized RabbitMQ client with host: {host}:{port}")
@@ -70,6 +116,9 @@ class RabbitMQClient:
         try:
             self.connection = pika.BlockingConnection(self.connection_params)
             self.channel = self.connection.channel()
+            self._declared.clear()
+            self._bound.clear()
+            self._alive = True
 
             # Declare default exchange
             self.channel.exchange_declare(
@@ -114,6 +163,8 @@ class RabbitMQClient:
             Queue name
         """
         self.ensure_connected()
+        if queue_name in self._declared:
+            return queue_name
 
         arguments = {}
         if dead_letter:
@@ -126,25 +177,54 @@ class RabbitMQClient:
             arguments=arguments
         )
 
-        if dead_letter:
+        # BlockingChannel has no nowait; each declare/bind below is a round trip,
+        # so every queue (and its dead-letter queue) is set up once per connection
+        dead_queue = f"{queue_name}.dead"
+        if dead_letter and dead_queue not in self._declared:
             # Declare the dead-letter queue
             self.channel.queue_declare(
-                queue=f"{queue_name}.dead",
+                queue=dead_queue,
                 durable=True
             )
 
             # Bind the dead-letter queue to the dead-letter exchange
             self.channel.queue_bind(
                 exchange=f"{self.exchange}.dlx",
-                queue=f"{queue_name}.dead",
-                routing_key=f"{queue_name}.dead"
+                queue=dead_queue,
+                routing_key=dead_queue
             )
+            self._declared.add(dead_queue)
 
+        self._declared.add(queue_name)
         logger.debug(f"Declared queue: {queue_name}")
         return queue_name
 
-    def publish(self, routing_key: str, message: Any,
-                persistent: bool = True, **properties) -> bool:
+    def bind_queue(self, queue_name: str) -> str:
+        """
+        Declare a queue and bind it to the exchange under its own name.
+
+        Messages published to the topic exchange are dropped until a queue is
+        bound for their routing key, so producers call this before publishing.
+
+        Args:
+            queue_name: Name of the queue, also used as the routing key
+
+        Returns:
+            Queue name
+        """
+        self.declare_queue(queue_name)
+
+        if queue_name not in self._bound:
+            self.channel.queue_bind(
+                exchange=self.exchange,
+                queue=queue_name,
+                routing_key=queue_name
+            )
+            self._bound.add(queue_name)
+        return queue_name
+
+    def publish(self, routing_key: str, message: Any, persistent: bool = True,
+                include_timestamp: bool = False, **properties) -> bool:
         """
         Publish a message.
 
@@ -152,43 +232,99 @@ class RabbitMQClient:
             routing_key: Routing key
             message: Message to publish (will be JSON serialized)
             persistent: Whether message should survive server restarts
+            include_timestamp: Whether to set the timestamp property
             **properties: Additional message properties
 
         Returns:
             True if successful, False otherwise
         """
-        self.ensure_connected()
+        if not self._alive:
+            self.connect()
 
         try:
-            # Serialize message to JSON if it's not already a string
-            if not isinstance(message, str):
-                message = json.dumps(message)
-
-            # Convert string to bytes if necessary
+            # Serialize message to JSON unless it is already encoded
             if isinstance(message, str):
                 message = message.encode('utf-8')
+            elif not isinstance(message, (bytes, bytearray)):
+                message = _dumps(message)
 
-            # Default properties
-            props = {
-                'delivery_mode': 2 if persistent else 1,  # 2 for persistent
-                'timestamp': int(time.time()),
-                'content_type': 'application/json',
-            }
-            # Update with user-provided properties
-            props.update(properties)
-
-            self.channel.basic_publish(
-                exchange=self.exchange,
-                routing_key=routing_key,
-                body=message,
-                properties=pika.BasicProperties(**props)
-            )
+            self._basic_publish(routing_key, message,
+                                _message_properties(persistent, include_timestamp, properties))
             logger.debug(f"Published message to {routing_key}")
             return True
         except Exception as e:
             logger.error(f"Failed to publish message to {routing_key}: {str(e)}")
             return False
 
+    def publish_many(self, routing_key: str, messages: Iterable[Any], persistent: bool = True,
+                     batch: int = 256, include_timestamp: bool = False, **properties) -> int:
+        """
+        Publish several messages back to back.
+
+        Frames are written without waiting on the broker; every ``batch``
+        messages pending I/O (heartbeats, flow control) is serviced once.
+
+        Args:
+            routing_key: Routing key
+            messages: Messages to publish (will be JSON serialized)
+            persistent: Whether messages should survive server restarts
+            batch: Number of messages between I/O servicing
+            include_timestamp: Whether to set the timestamp property
+            **properties: Additional message properties
+
+        Returns:
+            Number of messages published
+        """
+        if not self._alive:
+            self.connect()
+
+        basic_properties = _message_properties(persistent, include_timestamp, properties)
+
+        published = 0
+        try:
+            for message in messages:
+                if isinstance(message, str):
+                    message = message.encode('utf-8')
+                elif not isinstance(message, (bytes, bytearray)):
+                    message = _dumps(message)
+
+                self._basic_publish(routing_key, message, basic_properties)
+                published += 1
+                if published % batch == 0:
+                    self.connection.process_data_events(time_limit=0)
+
+            logger.debug(f"Published {published} messages to {routing_key}")
+        except Exception as e:
+            logger.error(f"Failed to publish message {published + 1} to {routing_key}: {str(e)}")
+
+        return published
+
+    def _basic_publish(self, routing_key: str, body: bytes,
+                       properties: pika.BasicProperties) -> None:
+        """
+        Publish a frame, reconnecting once if the connection was lost.
+
+        The liveness flag is not updated by pika when the broker drops the
+        connection, so a dead connection is discovered by the failed publish.
+        """
+        try:
+            self.channel.basic_publish(
+                exchange=self.exchange,
+                routing_key=routing_key,
+                body=body,
+                properties=properties
+            )
+        except (pika.exceptions.AMQPConnectionError, pika.exceptions.AMQPChannelError):
+            self._alive = False
+            logger.warning("RabbitMQ connection lost while publishing, reconnecting...")
+            self.connect()
+            self.channel.basic_publish(
+                exchange=self.exchange,
+                routing_key=routing_key,
+                body=body,
+                properties=properties
+            )
+
     def consume(self, queue_name: str, callback: Callable,
                 auto_ack: bool = False) -> None:
         """
@@ -201,22 +337,15 @@ class RabbitMQClient:
         """
         self.ensure_connected()
 
-        # Ensure queue exists
-        self.declare_queue(queue_name)
-
-        # Bind queue to exchange with routing key
-        self.channel.queue_bind(
-            exchange=self.exchange,
-            queue=queue_name,
-            routing_key=queue_name
-        )
+        # Ensure queue exists and is bound to the exchange
+        self.bind_queue(queue_name)
 
         def wrapped_callback(ch, method, properties, body):
             try:
                 # Deserialize JSON
                 try:
-                    message = json.loads(body)
-                except json.JSONDecodeError:
+                    message = _loads(body)
+                except ValueError:
                     message = body.decode('utf-8')
 
                 # Call user callback
@@ -254,6 +383,7 @@ class RabbitMQClient:
 
     def close(self) -> None:
         """Close the connection to RabbitMQ."""
+        self._alive = False
         if self.connection and self.connection.is_open:
             self.connection.close()
             logger.info("Closed RabbitMQ connection")
@@ -266,16 +396,26 @@ def get_rabbitmq_client() -> RabbitMQClient:
     Returns:
         RabbitMQClient instance
     """
-    if not hasattr(_thread_locals, 'rabbitmq_client'):
-        _thread_locals.rabbitmq_client = RabbitMQClient(
-            host=os.environ.get('RABBITMQ_HOST', 'rabbitmq'),
-            port=int(os.environ.get('RABBITMQ_PORT', '5672')),
-            username=os.environ.get('RABBITMQ_USERNAME', 'guest'),
-            password=os.environ.get('RABBITMQ_PASSWORD', 'guest'),
-            virtual_host=os.environ.get('RABBITMQ_VHOST', '/'),
-        )
+    # pika connections are not thread-safe, so each thread owns its client.
+    # The fast path is a single lock-free thread-local lookup.
+    client = getattr(_thread_locals, 'rabbitmq_client', None)
+    if client is None:
+        client = RabbitMQClient(**_client_settings())
+        _thread_locals.rabbitmq_client = client
+
+    return client
+
 
-    return _thread_locals.rabbitmq_client
+@lru_cache(maxsize=1)
+def _client_settings() -> Dict[str, Any]:
+    """Read RabbitMQ connection settings from the environment once per process."""
+    return {
+        'host': os.environ.get('RABBITMQ_HOST', 'rabbitmq'),
+        'port': int(os.environ.get('RABBITMQ_PORT', '5672')),
+        'username': os.environ.get('RABBITMQ_USERNAME', 'guest'),
+        'password': os.environ.get('RABBITMQ_PASSWORD', 'guest'),
+        'virtual_host': os.environ.get('RABBITMQ_VHOST', '/'),
+    }
 
 
 # Helper functions for common queue operations
@@ -295,6 +435,21 @@ def publish_message(routing_key: str, message: Any, **kwargs) -> bool:
     return get_rabbitmq_client().publish(routing_key, message, **kwargs)
 
 
+def publish_messages(routing_key: str, messages: Iterable[Any], **kwargs) -> int:
+    """
+    Publish several messages to RabbitMQ back to back.
+
+    Args:
+        routing_key: Routing key
+        messages: Messages to publish
+        **kwargs: Additional message properties
+
+    Returns:
+        Number of messages published
+    """
+    return get_rabbitmq_client().publish_many(routing_key, messages, **kwargs)
+
+
 def task_queue(queue_name: str):
     """
     Decorate function to queue function calls as tasks.
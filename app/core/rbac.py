@@ -5,15 +5,41 @@ Provides comprehensive access control functionality for the application.
 Last updated: 2025-08-30 22:40:55 UTC by nullroute-commits
 """
 import logging
-from typing import List, Optional, Set
+import operator
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 from functools import wraps
-from django.core.cache import cache
+from cachetools import TTLCache
+from django.conf import settings
+from sqlalchemy import delete, select
+from sqlalchemy.orm import selectinload
 from app.core.db.connection import get_db_session
-from app.core.models import User, Role, Permission
-from app.core.cache.memcached import cache_get, cache_set
+from app.core.models import User, Role, Permission, user_roles
+from app.core.cache.memcached import cache_get_many, cache_incr, cache_set
 
 logger = logging.getLogger(__name__)
 
+# Global generation counter embedded in every cached RBAC entry; bumping it
+# invalidates all of them at once
+RBAC_REVISION_KEY = "rbac_revision"
+
+# Stands in for the full permission list of a superuser
+ALL_PERMISSIONS = "*"
+
+# Revision bumps held back by the active RBACManager.deferred_invalidation()
+_pending_bumps: ContextVar[Optional[List[Dict[uuid.UUID, frozenset]]]] = ContextVar(
+    '_pending_bumps', default=None
+)
+
+
+def _as_uuid(value) -> uuid.UUID:
+    """Normalize a user or role id so session.get() can hit the identity map."""
+    return value if isinstance(value, uuid.UUID) else uuid.UUID(str(value))
+
 
 class RBACManager:
     """
@@ -27,14 +53,35 @@ class RBACManager:
     - Audit logging integration
     """
 
-    def __init__(self, cache_timeout: int = 300):
+    def __init__(self, cache_timeout: int = 300, local_cache_size: int = 10_000,
+                 local_cache_ttl: float = 5, negative_cache_timeout: int = 30):
         """
         Initialize RBAC Manager.
 
         Args:
             cache_timeout: Cache timeout in seconds
+            local_cache_size: Maximum entries in the in-process cache
+            local_cache_ttl: In-process cache lifetime in seconds (0 disables it)
+            negative_cache_timeout: Cache timeout in seconds for unknown users
         """
         self.cache_timeout = cache_timeout
+        # Unknown users are cached briefly so a user created later shows up soon
+        self.negative_cache_timeout = min(negative_cache_timeout, cache_timeout)
+
+        # Decoded results kept in-process so repeated checks skip memcached.
+        # Revision bumps from other processes are seen after local_cache_ttl;
+        # the revision itself is always read past the memcached client's own
+        # in-process cache, so that staleness does not stack.
+        self._local: Optional[TTLCache] = None
+        self._local_lock = threading.Lock()
+        if local_cache_ttl > 0:
+            self._local = TTLCache(maxsize=local_cache_size, ttl=local_cache_ttl)
+
+        # Role name -> id, filled as roles are looked up; names are unique
+        self._role_ids: Dict[str, uuid.UUID] = {}
+
+        # (revision, {role id: permission names}) for every active role
+        self._snapshot: Optional[Tuple[int, Dict[uuid.UUID, frozenset]]] = None
 
     def get_user_permissions(self, user_id: str, use_cache: bool = True) -> Set[str]:
         """
@@ -45,37 +92,41 @@ class RBACManager:
             use_cache: Whether to use cache
 
         Returns:
-            Set of permission names
+            Set of permission names, or ``{ALL_PERMISSIONS}`` for a superuser
         """
         cache_key = f"user_permissions:{user_id}"
+        revision = None
 
         if use_cache:
-            cached_permissions = cache_get(cache_key)
-            if cached_permissions is not None:
-                return set(cached_permissions)
+            cached, revision = self._get_cached(cache_key)
+            if cached is not None:
+                return set(cached)
 
         permissions = set()
 
         with get_db_session() as session:
-            user = session.query(User).filter(User.id == user_id).first()
-            if not user:
+            # Only the user's role ids are read; permissions come from the snapshot
+            rows = session.execute(
+                select(User.is_superuser, user_roles.c.role_id)
+                .outerjoin(user_roles, user_roles.c.user_id == User.id)
+                .where(User.id == _as_uuid(user_id))
+            ).all()
+            if not rows:
+                if use_cache:
+                    self._set_cached(cache_key, permissions, revision, self.negative_cache_timeout)
                 return permissions
 
-            # Superuser has all permissions
-            if user.is_superuser:
-                all_permissions = session.query(Permission).filter(Permission.is_active.is_(True)).all()
-                permissions = {perm.name for perm in all_permissions}
+            # Superuser has all permissions; no need to list them
+            if rows[0].is_superuser:
+                permissions = {ALL_PERMISSIONS}
             else:
                 # Get permissions from active roles
-                for role in user.roles:
-                    if role.is_active:
-                        for permission in role.permissions:
-                            if permission.is_active:
-                                permissions.add(permission.name)
+                snapshot = self._role_permissions(session, revision)
+                permissions = set().union(*(snapshot.get(row.role_id, ()) for row in rows))
 
         # Cache the result
         if use_cache:
-            cache_set(cache_key, list(permissions), self.cache_timeout)
+            self._set_cached(cache_key, permissions, revision)
 
         return permissions
 
@@ -93,20 +144,23 @@ class RBACManager:
         cache_key = f"user_roles:{user_id}"
 
         if use_cache:
-            cached_roles = cache_get(cache_key)
-            if cached_roles is not None:
-                return set(cached_roles)
+            cached, revision = self._get_cached(cache_key)
+            if cached is not None:
+                return set(cached)
 
         roles = set()
+        timeout = self.cache_timeout
 
         with get_db_session() as session:
-            user = session.query(User).filter(User.id == user_id).first()
+            user = session.get(User, _as_uuid(user_id), options=[selectinload(User.roles)])
             if user:
                 roles = {role.name for role in user.roles if role.is_active}
+            else:
+                timeout = self.negative_cache_timeout
 
         # Cache the result
         if use_cache:
-            cache_set(cache_key, list(roles), self.cache_timeout)
+            self._set_cached(cache_key, roles, revision, timeout)
 
         return roles
 
@@ -122,8 +176,17 @@ class RBACManager:
         Returns:
             True if user has permission, False otherwise
         """
-        permissions = self.get_user_permissions(user_id, use_cache)
-        return permission_name in permissions
+        if not use_cache:
+            permissions = self.get_user_permissions(user_id, use_cache=False)
+            return ALL_PERMISSIONS in permissions or permission_name in permissions
+
+        cache_key = f"user_perm:{user_id}:{permission_name}"
+        allowed, revision = self._get_cached_flag(cache_key)
+        if allowed is None:
+            permissions = self.get_user_permissions(user_id)
+            allowed = ALL_PERMISSIONS in permissions or permission_name in permissions
+            self._set_cached_flag(cache_key, allowed, revision, self._flag_timeout(permissions))
+        return allowed
 
     def has_role(self, user_id: str, role_name: str, use_cache: bool = True) -> bool:
         """
@@ -137,8 +200,297 @@ class RBACManager:
         Returns:
             True if user has role, False otherwise
         """
-        roles = self.get_user_roles(user_id, use_cache)
-        return role_name in roles
+        if not use_cache:
+            return role_name in self.get_user_roles(user_id, use_cache=False)
+
+        cache_key = f"user_role:{user_id}:{role_name}"
+        allowed, revision = self._get_cached_flag(cache_key)
+        if allowed is None:
+            roles = self.get_user_roles(user_id)
+            allowed = role_name in roles
+            self._set_cached_flag(cache_key, allowed, revision, self._flag_timeout(roles))
+        return allowed
+
+    def _get_cached(self, cache_key: str) -> Tuple[Optional[frozenset], Optional[int]]:
+        """
+        Read a cached RBAC entry, from the in-process cache or from memcached.
+
+        Memcached entries are raw bytes, ``b"<revision>\\n<name>\\n<name>..."``,
+        so hits skip pickle; they are read together with the current revision
+        in one round trip, and one written under another revision is a miss.
+        The revision is read before the database, so a result computed across
+        a bump is cached already stale.
+
+        Args:
+            cache_key: Cache key of the entry
+
+        Returns:
+            Tuple of (cached data or None on miss, current revision or None
+            on an in-process hit)
+        """
+        local = self._get_local(cache_key)
+        if local is not None:
+            return local, None
+
+        cached = cache_get_many([cache_key, RBAC_REVISION_KEY], use_local=False)
+        revision = cached.get(RBAC_REVISION_KEY)
+        if revision is None:
+            return None, self._reset_revision()
+
+        entry = cached.get(cache_key)
+        if not isinstance(entry, bytes):
+            return None, revision
+
+        entry_revision, _, names = entry.partition(b'\n')
+        if entry_revision != b'%d' % revision:
+            return None, revision
+
+        data = frozenset(names.decode('utf-8').split('\n')) if names else frozenset()
+        self._set_local(cache_key, data)
+        return data, revision
+
+    def _set_cached(self, cache_key: str, data: Set[str], revision: int,
+                    timeout: Optional[int] = None) -> None:
+        """
+        Cache an RBAC entry in memcached and in-process.
+
+        Args:
+            cache_key: Cache key of the entry
+            data: Permission or role names
+            revision: Revision read before computing the entry
+            timeout: Memcached timeout in seconds (defaults to cache_timeout)
+        """
+        entry = b'%d\n' % revision + '\n'.join(data).encode('utf-8')
+        cache_set(cache_key, entry, timeout or self.cache_timeout)
+        self._set_local(cache_key, frozenset(data))
+
+    def _get_cached_flag(self, cache_key: str) -> Tuple[Optional[bool], Optional[int]]:
+        """
+        Read a cached permission/role check, from the in-process cache or from memcached.
+
+        Memcached flags are stored as ``b"1:<revision>"`` / ``b"0:<revision>"``.
+
+        Args:
+            cache_key: Cache key of the flag
+
+        Returns:
+            Tuple of (cached result or None on miss, current revision or None
+            on an in-process hit)
+        """
+        local = self._get_local(cache_key)
+        if local is not None:
+            return local, None
+
+        cached = cache_get_many([cache_key, RBAC_REVISION_KEY], use_local=False)
+        revision = cached.get(RBAC_REVISION_KEY)
+        if revision is None:
+            return None, self._reset_revision()
+
+        flag = cached.get(cache_key)
+        if flag == b'1:%d' % revision:
+            allowed = True
+        elif flag == b'0:%d' % revision:
+            allowed = False
+        else:
+            return None, revision
+
+        self._set_local(cache_key, allowed)
+        return allowed, revision
+
+    def _set_cached_flag(self, cache_key: str, allowed: bool, revision: int,
+                         timeout: Optional[int] = None) -> None:
+        """
+        Cache a permission/role check in memcached and in-process.
+
+        Args:
+            cache_key: Cache key of the flag
+            allowed: Result of the check
+            revision: Revision read before computing the result
+            timeout: Memcached timeout in seconds (defaults to cache_timeout)
+        """
+        cache_set(cache_key, b'%d:%d' % (allowed, revision), timeout or self.cache_timeout)
+        self._set_local(cache_key, allowed)
+
+    def _flag_timeout(self, names: Set[str]) -> int:
+        """
+        Get the cache timeout for a check computed from a user's permissions or roles.
+
+        An empty set is what an unknown user gets, so checks derived from it
+        expire as soon as the negative entry they were computed from.
+
+        Args:
+            names: Permission or role names the check was computed from
+
+        Returns:
+            Timeout in seconds
+        """
+        return self.cache_timeout if names else self.negative_cache_timeout
+
+    def _get_local(self, cache_key: str) -> Any:
+        """Return an entry from the in-process cache, or None."""
+        if self._local is None:
+            return None
+        with self._local_lock:
+            return self._local.get(cache_key)
+
+    def _set_local(self, cache_key: str, value: Any) -> None:
+        """Store an entry in the in-process cache."""
+        if self._local is not None:
+            with self._local_lock:
+                self._local[cache_key] = value
+
+    def _reset_revision(self) -> int:
+        """
+        Start a new revision after the counter was evicted or never set.
+
+        The revision is seeded from the clock in milliseconds, so it is
+        always ahead of any revision that cached entries still carry.
+
+        Returns:
+            New revision
+        """
+        revision = int(time.time() * 1000)
+        cache_set(RBAC_REVISION_KEY, revision, 0)
+        return revision
+
+    def _bump_revision(self, roles: Optional[Dict[uuid.UUID, frozenset]] = None) -> None:
+        """
+        Invalidate every cached RBAC entry after a change made by this process.
+
+        If no other process bumped the revision since the role snapshot was
+        built, the snapshot is carried over to the new revision instead of
+        being rebuilt on the next read.
+
+        Args:
+            roles: Permission names of roles created by the change, by role id
+        """
+        pending = _pending_bumps.get()
+        if pending is not None:
+            pending.append(roles or {})
+            return
+
+        revision = cache_incr(RBAC_REVISION_KEY)
+        if revision is None:
+            self._reset_revision()
+        else:
+            snapshot = self._snapshot
+            if snapshot is not None and snapshot[0] == revision - 1:
+                self._snapshot = (revision, {**snapshot[1], **roles} if roles else snapshot[1])
+
+        if self._local is not None:
+            with self._local_lock:
+                self._local.clear()
+
+    @contextmanager
+    def deferred_invalidation(self) -> Iterator[None]:
+        """
+        Coalesce the cache invalidations of several RBAC changes into one.
+
+        Changes inside the block still commit individually; the single
+        revision bump runs on exit, including when the block raises, since
+        earlier changes are already committed. Until then, cached checks
+        may not reflect the changes.
+
+        Usage:
+            with rbac_manager.deferred_invalidation():
+                for role_name in role_names:
+                    rbac_manager.assign_role(user_id, role_name)
+        """
+        if _pending_bumps.get() is not None:
+            # Nested blocks bump with the outermost one
+            yield
+            return
+
+        pending: List[Dict[uuid.UUID, frozenset]] = []
+        token = _pending_bumps.set(pending)
+        try:
+            yield
+        finally:
+            _pending_bumps.reset(token)
+            if pending:
+                roles: Dict[uuid.UUID, frozenset] = {}
+                for created in pending:
+                    roles.update(created)
+                self._bump_revision(roles)
+
+    def warmup(self) -> int:
+        """
+        Build the role snapshot ahead of the first permission check.
+
+        Meant to run once per worker process at startup; failures are logged
+        and leave the snapshot to be built on first use.
+
+        Returns:
+            Number of active roles in the snapshot
+        """
+        try:
+            revision = cache_get_many([RBAC_REVISION_KEY], use_local=False).get(RBAC_REVISION_KEY)
+            if revision is None:
+                revision = self._reset_revision()
+
+            with get_db_session() as session:
+                roles = len(self._role_permissions(session, revision))
+        except Exception:
+            logger.exception("Failed to warm RBAC role snapshot")
+            return 0
+
+        logger.info("Warmed RBAC role snapshot with %s roles", roles)
+        return roles
+
+    def _role_permissions(self, session,
+                          revision: Optional[int]) -> Dict[uuid.UUID, frozenset]:
+        """
+        Return the permission names of every active role.
+
+        The mapping is kept for the process and rebuilt with a single query
+        (plus one selectin load) whenever the RBAC revision has moved.
+
+        Args:
+            session: Database session
+            revision: Current RBAC revision, or None to force a rebuild
+
+        Returns:
+            Mapping of role id to active permission names
+        """
+        snapshot = self._snapshot
+        if revision is not None and snapshot is not None and snapshot[0] == revision:
+            return snapshot[1]
+
+        roles = session.scalars(
+            select(Role).where(Role.is_active.is_(True)).options(selectinload(Role.permissions))
+        )
+        mapping = {
+            role.id: frozenset(perm.name for perm in role.permissions if perm.is_active)
+            for role in roles
+        }
+        if revision is not None:
+            self._snapshot = (revision, mapping)
+        return mapping
+
+    def _get_role(self, session, role_name: str) -> Optional[Role]:
+        """
+        Look up a role by name, by primary key once its id is known.
+
+        Args:
+            session: Database session
+            role_name: Role name
+
+        Returns:
+            Role, or None if no role has that name
+        """
+        role_id = self._role_ids.get(role_name)
+        if role_id is not None:
+            role = session.get(Role, role_id)
+            # Deleted or renamed roles fall through to the lookup by name
+            if role is not None and role.name == role_name:
+                return role
+
+        role = session.query(Role).filter(Role.name == role_name).first()
+        if role is not None:
+            self._role_ids[role_name] = role.id
+        else:
+            self._role_ids.pop(role_name, None)
+        return role
 
     def assign_role(self, user_id: str, role_name: str, assigned_by: Optional[str] = None) -> bool:
         """
@@ -154,16 +506,16 @@ class RBACManager:
         """
         try:
             with get_db_session() as session:
-                user = session.query(User).filter(User.id == user_id).first()
-                role = session.query(Role).filter(Role.name == role_name, Role.is_active.is_(True)).first()
+                user = session.get(User, _as_uuid(user_id), options=[selectinload(User.roles)])
+                role = self._get_role(session, role_name)
 
-                if not user or not role:
-                    logger.warning(f"User {user_id} or role {role_name} not found")
+                if not user or not role or not role.is_active:
+                    logger.warning("User %s or role %s not found", user_id, role_name)
                     return False
 
                 # Check if user already has the role
-                if role in user.roles:
-                    logger.info(f"User {user_id} already has role {role_name}")
+                if role.id in {user_role.id for user_role in user.roles}:
+                    logger.info("User %s already has role %s", user_id, role_name)
                     return True
 
                 # Assign the role
@@ -173,14 +525,14 @@ class RBACManager:
 
                 session.commit()
 
-                # Clear cache
-                self._clear_user_cache(user_id)
+                # Invalidate cached RBAC entries
+                self._bump_revision()
 
-                logger.info(f"Assigned role {role_name} to user {user_id}")
+                logger.info("Assigned role %s to user %s", role_name, user_id)
                 return True
 
-        except Exception as e:
-            logger.error(f"Failed to assign role {role_name} to user {user_id}: {str(e)}")
+        except Exception:
+            logger.exception("Failed to assign role %s to user %s", role_name, user_id)
             return False
 
     def revoke_role(self, user_id: str, role_name: str, revoked_by: Optional[str] = None) -> bool:
@@ -197,33 +549,36 @@ class RBACManager:
         """
         try:
             with get_db_session() as session:
-                user = session.query(User).filter(User.id == user_id).first()
-                role = session.query(Role).filter(Role.name == role_name).first()
+                user = session.get(User, _as_uuid(user_id), options=[selectinload(User.roles)])
+                role = self._get_role(session, role_name)
 
                 if not user or not role:
-                    logger.warning(f"User {user_id} or role {role_name} not found")
+                    logger.warning("User %s or role %s not found", user_id, role_name)
                     return False
 
                 # Check if user has the role
-                if role not in user.roles:
-                    logger.info(f"User {user_id} does not have role {role_name}")
+                if role.id not in {user_role.id for user_role in user.roles}:
+                    logger.info("User %s does not have role %s", user_id, role_name)
                     return True
 
-                # Revoke the role
-                user.roles.remove(role)
+                # Revoke the role with a single DELETE instead of mutating the collection
+                session.execute(delete(user_roles).where(
+                    user_roles.c.user_id == user.id,
+                    user_roles.c.role_id == role.id
+                ))
                 if revoked_by:
                     user.updated_by = revoked_by
 
                 session.commit()
 
-                # Clear cache
-                self._clear_user_cache(user_id)
+                # Invalidate cached RBAC entries
+                self._bump_revision()
 
-                logger.info(f"Revoked role {role_name} from user {user_id}")
+                logger.info("Revoked role %s from user %s", role_name, user_id)
                 return True
 
-        except Exception as e:
-            logger.error(f"Failed to revoke role {role_name} from user {user_id}: {str(e)}")
+        except Exception:
+            logger.exception("Failed to revoke role %s from user %s", role_name, user_id)
             return False
 
     def create_role(self, name: str, description: str = None, permissions: List[str] = None,
@@ -245,7 +600,7 @@ class RBACManager:
                 # Check if role already exists
                 existing_role = session.query(Role).filter(Role.name == name).first()
                 if existing_role:
-                    logger.warning(f"Role {name} already exists")
+                    logger.warning("Role %s already exists", name)
                     return None
 
                 # Create the role
@@ -265,12 +620,14 @@ class RBACManager:
 
                 session.add(role)
                 session.commit()
+                # The new role's permission names are known here; hand them to the snapshot
+                self._bump_revision({role.id: frozenset(perm.name for perm in role.permissions)})
 
-                logger.info(f"Created role {name}")
+                logger.info("Created role %s", name)
                 return str(role.id)
 
-        except Exception as e:
-            logger.error(f"Failed to create role {name}: {str(e)}")
+        except Exception:
+            logger.exception("Failed to create role %s", name)
             return None
 
     def create_permission(self, name: str, resource: str, action: str,
@@ -293,7 +650,7 @@ class RBACManager:
                 # Check if permission already exists
                 existing_permission = session.query(Permission).filter(Permission.name == name).first()
                 if existing_permission:
-                    logger.warning(f"Permission {name} already exists")
+                    logger.warning("Permission %s already exists", name)
                     return None
 
                 # Create the permission
@@ -307,30 +664,29 @@ class RBACManager:
 
                 session.add(permission)
                 session.commit()
+                self._bump_revision()
 
-                logger.info(f"Created permission {name}")
+                logger.info("Created permission %s", name)
                 return str(permission.id)
 
-        except Exception as e:
-            logger.error(f"Failed to create permission {name}: {str(e)}")
+        except Exception:
+            logger.exception("Failed to create permission %s", name)
             return None
 
-    def _clear_user_cache(self, user_id: str):
-        """Clear cached data for a user."""
-        cache_keys = [
-            f"user_permissions:{user_id}",
-            f"user_roles:{user_id}"
-        ]
 
-        for key in cache_keys:
-            cache.delete(key)
+# Global RBAC manager instance, created on first use so that importing this
+# module does not require configured Django settings
+_rbac_manager: Optional[RBACManager] = None
+_rbac_manager_lock = threading.Lock()
 
 
-# Global RBAC manager instance
-rbac_manager = RBACManager()
+# Decorator functions for permission checking
+
+# Reads request.user_id in C; a missing request or attribute means unauthenticated
+_get_user_id = operator.attrgetter('user_id')
+_NOT_AUTHENTICATED = "User not authenticated"
 
 
-# Decorator functions for permission checking
 def require_permission(permission_name: str):
     """
     Decorate function to require a specific permission.
@@ -342,15 +698,21 @@ def require_permission(permission_name: str):
         Decorated function
     """
     def decorator(func):
+        # Bound once so each call skips the global and attribute lookups
+        check = get_rbac_manager().has_permission
+
         @wraps(func)
         def wrapper(*args, **kwargs):
             # Get user from request context (this would be implemented based on your auth system)
-            user_id = getattr(kwargs.get('request'), 'user_id', None)
+            try:
+                user_id = _get_user_id(kwargs.get('request'))
+            except AttributeError:
+                user_id = None
 
             if not user_id:
-                raise PermissionError("User not authenticated")
+                raise PermissionError(_NOT_AUTHENTICATED)
 
-            if not rbac_manager.has_permission(user_id, permission_name):
+            if not check(user_id, permission_name):
                 raise PermissionError(f"User does not have permission: {permission_name}")
 
             return func(*args, **kwargs)
@@ -369,15 +731,21 @@ def require_role(role_name: str):
         Decorated function
     """
     def decorator(func):
+        # Bound once so each call skips the global and attribute lookups
+        check = get_rbac_manager().has_role
+
         @wraps(func)
         def wrapper(*args, **kwargs):
             # Get user from request context (this would be implemented based on your auth system)
-            user_id = getattr(kwargs.get('request'), 'user_id', None)
+            try:
+                user_id = _get_user_id(kwargs.get('request'))
+            except AttributeError:
+                user_id = None
 
             if not user_id:
-                raise PermissionError("User not authenticated")
+                raise PermissionError(_NOT_AUTHENTICATED)
 
-            if not rbac_manager.has_role(user_id, role_name):
+            if not check(user_id, role_name):
                 raise PermissionError(f"User does not have role: {role_name}")
 
             return func(*args, **kwargs)
@@ -395,21 +763,30 @@ def require_any_permission(*permission_names: str):
     Returns:
         Decorated function
     """
+    required = frozenset(permission_names)
+    denied_message = (
+        f"User does not have any of the required permissions: {', '.join(permission_names)}"
+    )
+
     def decorator(func):
+        # Bound once so each call skips the global and attribute lookups
+        check = get_rbac_manager().get_user_permissions
+
         @wraps(func)
         def wrapper(*args, **kwargs):
             # Get user from request context (this would be implemented based on your auth system)
-            user_id = getattr(kwargs.get('request'), 'user_id', None)
+            try:
+                user_id = _get_user_id(kwargs.get('request'))
+            except AttributeError:
+                user_id = None
 
             if not user_id:
-                raise PermissionError("User not authenticated")
+                raise PermissionError(_NOT_AUTHENTICATED)
 
-            user_permissions = rbac_manager.get_user_permissions(user_id)
+            user_permissions = check(user_id)
 
-            if not any(perm in user_permissions for perm in permission_names):
-                raise PermissionError(
-                    f"User does not have any of the required permissions: {
-                        ', '.join(permission_names)}")
+            if ALL_PERMISSIONS not in user_permissions and required.isdisjoint(user_permissions):
+                raise PermissionError(denied_message)
 
             return func(*args, **kwargs)
         return wrapper
@@ -419,9 +796,25 @@ def require_any_permission(*permission_names: str):
 # Helper functions
 def get_rbac_manager() -> RBACManager:
     """
-    Get the global RBAC manager instance.
+    Get or create the global RBAC manager instance.
 
     Returns:
         RBACManager instance
     """
-    return rbac_manager
+    global _rbac_manager
+    if _rbac_manager is None:
+        with _rbac_manager_lock:
+            if _rbac_manager is None:
+                _rbac_manager = RBACManager(
+                    cache_timeout=getattr(settings, 'RBAC_CACHE_TIMEOUT', 300),
+                    negative_cache_timeout=getattr(settings, 'RBAC_NEGATIVE_CACHE_TIMEOUT', 30),
+                )
+
+    return _rbac_manager
+
+
+def __getattr__(name: str) -> Any:
+    """Create ``rbac_manager`` lazily on first access."""
+    if name == 'rbac_manager':
+        return get_rbac_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -187,10 +187,33 @@ CSRF_COOKIE_HTTPONLY = True
 
 # RBAC settings
 RBAC_CACHE_TIMEOUT = int(os.environ.get('RBAC_CACHE_TIMEOUT', '300'))
+# Lookups of unknown users are cached for at most this long
+RBAC_NEGATIVE_CACHE_TIMEOUT = int(os.environ.get('RBAC_NEGATIVE_CACHE_TIMEOUT', '30'))
+# Load the role -> permission snapshot when a WSGI worker starts
+RBAC_WARMUP = os.environ.get('RBAC_WARMUP', 'False').lower() == 'true'
 RBAC_SESSION_TIMEOUT = int(os.environ.get('RBAC_SESSION_TIMEOUT', '3600'))
 
 # Audit logging settings
 AUDIT_ENABLED = os.environ.get('AUDIT_ENABLED', 'True').lower() == 'true'
 AUDIT_LOG_MODELS = os.environ.get('AUDIT_LOG_MODELS', 'True').lower() == 'true'
 AUDIT_LOG_REQUESTS = os.environ.get('AUDIT_LOG_REQUESTS', 'True').lower() == 'true'
-AUDIT_LOG_AUTHENTICATION = os.environ.get('AUDIT_LOG_AUTHENTICATION', 'True').lower() == 'true'
\ No newline at end of file
+AUDIT_LOG_AUTHENTICATION = os.environ.get('AUDIT_LOG_AUTHENTICATION', 'True').lower() == 'true'
+AUDIT_QUEUE_SIZE = int(os.environ.get('AUDIT_QUEUE_SIZE', '10000'))
+AUDIT_BATCH_SIZE = int(os.environ.get('AUDIT_BATCH_SIZE', '500'))
+AUDIT_FLUSH_INTERVAL_MS = int(os.environ.get('AUDIT_FLUSH_INTERVAL_MS', '200'))
+AUDIT_HISTORY_DAYS = int(os.environ.get('AUDIT_HISTORY_DAYS', '90'))  # 0 = unbounded
+# Monthly audit_logs partitions older than this are dropped by
+# app.core.audit.drop_expired_audit_partitions
+AUDIT_RETENTION_MONTHS = int(os.environ.get('AUDIT_RETENTION_MONTHS', '0'))  # 0 = keep all
+# 'database' writes from the web process; 'rabbitmq' publishes batches for
+# app.core.audit.consume_audit_batches running in a separate worker
+AUDIT_BACKEND = os.environ.get('AUDIT_BACKEND', 'database')
+AUDIT_QUEUE_NAME = os.environ.get('AUDIT_QUEUE_NAME', 'audit.write')
+
+# Fraction of successful GET requests written by log_request (1.0 logs all).
+# AUDIT_SAMPLE_RULES may instead list (method, (low_status, high_status), rate)
+# tuples; the first matching rule wins and unmatched requests are always logged.
+AUDIT_GET_SAMPLE_RATE = float(os.environ.get('AUDIT_GET_SAMPLE_RATE', '1.0'))
+AUDIT_SAMPLE_RULES = [
+    ('GET', (200, 399), AUDIT_GET_SAMPLE_RATE),
+]
@@ -17,8 +17,15 @@ DATABASES['default'].update({
     'NAME': os.environ.get('POSTGRES_DB', 'django_app_test'),
 })
 
-# Use in-memory cache for testing
+# No-op cache for testing; tests of caching behaviour opt in to an in-memory
+# cache with @override_settings(CACHES=LOCMEM_CACHES)
 CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
+    }
+}
+
+LOCMEM_CACHES = {
     'default': {
         'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
         'LOCATION': 'test-cache',
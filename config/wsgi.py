@@ -5,8 +5,15 @@ Exposes the WSGI callable as a module-level variable named 'application'.
 Last updated: 2025-08-30 22:40:55 UTC by nullroute-commits
 """
 import os
+from django.conf import settings
 from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings.production')
 
-application = get_wsgi_application()
\ No newline at end of file
+application = get_wsgi_application()
+
+# Without --preload every gunicorn worker imports this module after forking,
+# so each worker warms its own RBAC snapshot before serving requests
+if getattr(settings, 'RBAC_WARMUP', False):
+    from app.core.rbac import get_rbac_manager
+    get_rbac_manager().warmup()
@@ -1,30 +1,39 @@
 """FastAPI application entry point."""
 
+import os
+from collections.abc import Mapping
 from contextlib import asynccontextmanager
+from importlib.util import find_spec
 from typing import Any, AsyncGenerator
 
-from fastapi import FastAPI, Request
+import structlog
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
-from prometheus_client import make_asgi_app
-from starlette.middleware.sessions import SessionMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
+from prometheus_client import REGISTRY, CollectorRegistry, make_asgi_app, multiprocess
 
+from src.api.middleware import SelectiveGZipMiddleware, SelectiveSessionMiddleware
 from src.core.config import get_settings
-from src.core.logging import setup_logging
+from src.core.logging import setup_logging, stop_logging
+from src.utils.health import close_redis_client
 from src.utils.health import router as health_router
 from src.utils.version import get_version_info
 
-# Initialize settings and logging
+# orjson is an optional C serializer that encodes several times faster than stdlib json
+ORJSON_AVAILABLE = find_spec("orjson") is not None
+DefaultJSONResponse = ORJSONResponse if ORJSON_AVAILABLE else JSONResponse
+
+# Settings are needed to build the app; logging is configured per worker in lifespan
 settings = get_settings()
-logger = setup_logging()
+logger = structlog.get_logger()
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan manager."""
     # Startup
+    setup_logging()
     logger.info(
         "Starting application",
         extra={
@@ -47,6 +56,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Cleanup
     # await cleanup_database()
     # await cleanup_cache()
+    await close_redis_client()
+
+    stop_logging()
 
 
 # Create FastAPI application
@@ -55,10 +67,14 @@ app = FastAPI(
     version=settings.app_version,
     debug=settings.debug,
     lifespan=lifespan,
+    default_response_class=DefaultJSONResponse,
     docs_url="/docs" if not settings.is_production else None,
     redoc_url="/redoc" if not settings.is_production else None,
 )
 
+# Endpoints that never read the session
+PROBE_PATHS = ("/health", "/ready", "/live", "/metrics", "/metrics/")
+
 # Add middlewares
 app.add_middleware(
     CORSMiddleware,
@@ -68,8 +84,18 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-app.add_middleware(GZipMiddleware, minimum_size=1000)
-app.add_middleware(SessionMiddleware, secret_key=settings.secret_key)
+app.add_middleware(
+    SelectiveGZipMiddleware,
+    minimum_size=settings.gzip_minimum_size,
+    compresslevel=settings.gzip_compresslevel,
+    # Small fixed-size JSON bodies
+    exclude_paths=("/", "/api/v1/version", "/health", "/ready", "/live"),
+)
+app.add_middleware(
+    SelectiveSessionMiddleware,
+    secret_key=settings.secret_key,
+    exclude_paths=PROBE_PATHS,
+)
 
 if settings.is_production:
     app.add_middleware(
@@ -77,8 +103,22 @@ if settings.is_production:
         allowed_hosts=["*.example.com", "example.com"],
     )
 
+
 # Mount Prometheus metrics
-metrics_app = make_asgi_app()
+def metrics_registry() -> CollectorRegistry:
+    """Get the registry to expose on /metrics.
+
+    With PROMETHEUS_MULTIPROC_DIR set, every worker writes its samples to that
+    directory and any worker can serve the aggregate, so one scrape covers all.
+    """
+    if "PROMETHEUS_MULTIPROC_DIR" not in os.environ:
+        return REGISTRY
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+metrics_app = make_asgi_app(registry=metrics_registry())
 app.mount("/metrics", metrics_app)
 
 # Include routers
@@ -90,13 +130,21 @@ app.include_router(health_router, tags=["health"])
 # app.include_router(items_router, prefix="/api/v1/items", tags=["items"])
 
 
+# Serialized once; only the Response wrapper is built per error
+INTERNAL_ERROR_BODY = DefaultJSONResponse(content={"detail": "Internal server error"}).body
+
+
 @app.exception_handler(Exception)
-async def global_exception_handler(request: Request, exc: Exception) -> JSONResponse:
-    """Global exception handler."""
+async def global_exception_handler(request: Request, exc: Exception) -> Response:
+    """Global exception handler.
+
+    Starlette routes HTTPException (404, 422, ...) through its own handler, so
+    only unexpected errors reach this one and pay for the traceback.
+    """
     logger.error(
         "Unhandled exception",
         extra={
-            "path": request.url.path,
+            "path": request.scope["path"],
             "method": request.method,
             "exception": str(exc),
         },
@@ -104,7 +152,7 @@ async def global_exception_handler(request: Request, exc: Exception) -> JSONResp
     )
 
     if settings.debug:
-        return JSONResponse(
+        return DefaultJSONResponse(
             status_code=500,
             content={
                 "detail": str(exc),
@@ -112,37 +160,49 @@ async def global_exception_handler(request: Request, exc: Exception) -> JSONResp
             },
         )
 
-    return JSONResponse(
-        status_code=500,
-        content={"detail": "Internal server error"},
-    )
+    return Response(INTERNAL_ERROR_BODY, status_code=500, media_type="application/json")
+
+
+# Static per process; built once instead of on every request
+ROOT_PAYLOAD: dict[str, Any] = {
+    "message": f"Welcome to {settings.app_name}",
+    "version": settings.app_version,
+    "environment": settings.environment,
+    "docs": "/docs" if not settings.is_production else None,
+}
 
 
 @app.get("/", response_model=dict[str, Any])
 async def root() -> dict[str, Any]:
     """Root endpoint."""
-    return {
-        "message": f"Welcome to {settings.app_name}",
-        "version": settings.app_version,
-        "environment": settings.environment,
-        "docs": "/docs" if not settings.is_production else None,
-    }
+    return ROOT_PAYLOAD
 
 
 @app.get("/api/v1/version", response_model=dict[str, Any])
-async def version() -> dict[str, Any]:
+async def version() -> Mapping[str, Any]:
     """Get application version information."""
     return get_version_info()
 
 
 if __name__ == "__main__":
+    import tempfile
+
     import uvicorn
 
+    workers = settings.api_workers if not settings.is_development else 1
+    if workers > 1:
+        # Must be set before the workers import prometheus_client
+        os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", tempfile.mkdtemp(prefix="prometheus-"))
+
     uvicorn.run(
         "src.api.main:app",
         host=settings.api_host,
         port=settings.api_port,
         reload=settings.is_development,
-        workers=settings.api_workers if not settings.is_development else 1,
+        workers=workers,
+        loop=settings.api_loop,
+        http=settings.api_http,
+        ws=settings.api_ws,
+        lifespan="on",
         log_level=settings.log_level.lower(),
     )
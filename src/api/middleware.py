@@ -0,0 +1,75 @@
+"""ASGI middlewares for the FastAPI application."""
+
+from collections.abc import Iterable
+from typing import Literal
+
+from starlette.datastructures import Secret
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.middleware.sessions import SessionMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class SelectiveGZipMiddleware(GZipMiddleware):
+    """GZip middleware that passes through paths known to return small bodies.
+
+    Starlette's responder allocates a gzip buffer for every request that accepts
+    gzip, even when the body ends up under ``minimum_size``; excluded paths skip it.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 500,
+        compresslevel: int = 9,
+        exclude_paths: Iterable[str] = (),
+    ) -> None:
+        """Initialize the middleware."""
+        super().__init__(app, minimum_size=minimum_size, compresslevel=compresslevel)
+        self.exclude_paths = frozenset(exclude_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Compress the response unless the path is excluded."""
+        if scope["type"] == "http" and scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
+class SelectiveSessionMiddleware(SessionMiddleware):
+    """Session middleware that passes through paths which never use the session.
+
+    Every other request builds an ``HTTPConnection``, parses the cookie header and
+    wraps ``send``; probes and metrics scrapes need none of that.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        secret_key: str | Secret,
+        session_cookie: str = "session",
+        max_age: int | None = 14 * 24 * 60 * 60,  # 14 days, in seconds
+        path: str = "/",
+        same_site: Literal["lax", "strict", "none"] = "lax",
+        https_only: bool = False,
+        domain: str | None = None,
+        exclude_paths: Iterable[str] = (),
+    ) -> None:
+        """Initialize the middleware."""
+        super().__init__(
+            app,
+            secret_key=secret_key,
+            session_cookie=session_cookie,
+            max_age=max_age,
+            path=path,
+            same_site=same_site,
+            https_only=https_only,
+            domain=domain,
+        )
+        self.exclude_paths = frozenset(exclude_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Load and save the session unless the path is excluded."""
+        if scope["type"] == "http" and scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
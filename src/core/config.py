@@ -1,9 +1,10 @@
 """Application configuration using Pydantic Settings."""
 
-from functools import lru_cache
-from typing import Any, Optional, Union
+import os
+from functools import cached_property, lru_cache
+from typing import Any, Literal, Optional, Union
 
-from pydantic import Field, PostgresDsn, RedisDsn, field_validator
+from pydantic import AliasChoices, Field, PostgresDsn, RedisDsn, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -15,6 +16,8 @@ class Settings(BaseSettings):
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",
+        # get_settings() hands one shared instance to every module
+        frozen=True,
     )
 
     # Application
@@ -27,7 +30,22 @@ class Settings(BaseSettings):
     api_prefix: str = Field(default="/api/v1")
     api_host: str = Field(default="0.0.0.0")
     api_port: int = Field(default=8000)
-    api_workers: int = Field(default=4)
+    # 2n+1 workers; WEB_CONCURRENCY takes precedence over API_WORKERS. Workers share
+    # no memory, so per-process state (caches, websockets) must live in Redis; the
+    # cookie-backed session is already stateless.
+    api_workers: int = Field(
+        default_factory=lambda: (os.cpu_count() or 1) * 2 + 1,
+        validation_alias=AliasChoices("web_concurrency", "api_workers"),
+    )
+    # "auto" picks uvloop when installed (not on Windows) and falls back to asyncio
+    api_loop: Literal["auto", "asyncio", "uvloop"] = Field(default="auto")
+    # httptools is a hard dependency, so select the C parser instead of probing for it
+    api_http: Literal["auto", "h11", "httptools"] = Field(default="httptools")
+    # No WebSocket routes; set to "websockets" or "wsproto" when adding one
+    api_ws: Literal["auto", "none", "websockets", "wsproto"] = Field(default="none")
+    # Bodies below ~one MTU gain little from compression
+    gzip_minimum_size: int = Field(default=1400)
+    gzip_compresslevel: int = Field(default=6)
 
     # Security
     secret_key: str
@@ -40,6 +58,10 @@ class Settings(BaseSettings):
     database_pool_size: int = Field(default=20)
     database_max_overflow: int = Field(default=0)
     database_echo: bool = Field(default=False)
+    database_pool_pre_ping: bool = Field(default=False)
+    database_use_external_pool: bool = Field(default=False)
+    database_pool_recycle: int = Field(default=1800)
+    database_pool_timeout: int = Field(default=10)
 
     # Redis
     redis_url: Union[RedisDsn, str]
@@ -76,17 +98,17 @@ class Settings(BaseSettings):
             return [origin.strip() for origin in v.split(",")]
         return v
 
-    @property
+    @cached_property
     def is_production(self) -> bool:
         """Check if running in production environment."""
         return self.environment == "production"
 
-    @property
+    @cached_property
     def is_development(self) -> bool:
         """Check if running in development environment."""
         return self.environment == "development"
 
-    @property
+    @cached_property
     def is_testing(self) -> bool:
         """Check if running in testing environment."""
         return self.environment == "testing"
@@ -96,7 +118,3 @@ class Settings(BaseSettings):
 def get_settings() -> Settings:
     """Get cached settings instance."""
     return Settings()
-
-
-# Export settings instance
-settings = get_settings()
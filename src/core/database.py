@@ -2,8 +2,9 @@
 
 from typing import Any, AsyncGenerator
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import NullPool
 
 from src.core.config import get_settings
 
@@ -12,24 +13,35 @@ settings = get_settings()
 # Create async engine with database-specific parameters
 engine_kwargs: dict[str, Any] = {
     "echo": settings.database_echo,
-    "pool_pre_ping": True,  # Enable connection health checks
+    # Off by default: pre-ping costs a SELECT 1 round trip on every checkout
+    "pool_pre_ping": settings.database_pool_pre_ping,
 }
 
+# Behind PgBouncer the pooler owns the connections; don't pool them twice
+if settings.database_use_external_pool:
+    engine_kwargs["poolclass"] = NullPool
 # Only add pool parameters for PostgreSQL
-if "postgres" in str(settings.database_url).lower():
+elif "postgres" in str(settings.database_url).lower():
     engine_kwargs.update(
         {
             "pool_size": settings.database_pool_size,
             "max_overflow": settings.database_max_overflow,
+            # Retire connections by age instead of probing them
+            "pool_recycle": settings.database_pool_recycle,
+            "pool_timeout": settings.database_pool_timeout,
+            # Reuse the most recently returned connection so idle ones can expire
+            "pool_use_lifo": True,
         }
     )
 
 engine = create_async_engine(str(settings.database_url), **engine_kwargs)
 
 # Create async session factory
-AsyncSessionLocal = sessionmaker(  # type: ignore
-    bind=engine,
-    class_=AsyncSession,
+AsyncSessionLocal = async_sessionmaker(engine, expire_on_commit=False)
+
+# Read-only sessions run in autocommit: no BEGIN/COMMIT round trips per request
+ReadSessionLocal = async_sessionmaker(
+    engine.execution_options(isolation_level="AUTOCOMMIT"),
     expire_on_commit=False,
 )
 
@@ -38,16 +50,23 @@ Base = declarative_base()
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """Get database session."""
+    """Get database session.
+
+    Endpoints that write must call ``commit()`` themselves; anything left
+    uncommitted is rolled back when the session closes.
+    """
     async with AsyncSessionLocal() as session:
         try:
             yield session
-            await session.commit()
         except Exception:
             await session.rollback()
             raise
-        finally:
-            await session.close()
+
+
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """Get an autocommit database session for read-only endpoints."""
+    async with ReadSessionLocal() as session:
+        yield session
 
 
 async def init_database() -> None:
@@ -1,28 +1,68 @@
 """Logging configuration."""
 
+import json
 import logging
+import logging.handlers
+import queue
 import sys
+from datetime import datetime, timezone
+from importlib.util import find_spec
+from typing import Any, Optional
 
 import structlog
-from pythonjsonlogger import jsonlogger
 
 from src.core.config import get_settings
 
+# orjson is an optional C serializer
+ORJSON_AVAILABLE = find_spec("orjson") is not None
+if ORJSON_AVAILABLE:  # pragma: no cover - depends on the install
+    import orjson
+
 settings = get_settings()
 
+# Drains queued records to stdout off the event loop thread
+_listener: Optional[logging.handlers.QueueListener] = None
+
+# Attributes every LogRecord carries; anything else was passed via ``extra``
+_RECORD_ATTRS = frozenset(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+
+def _dumps(obj: Any, **kwargs: Any) -> str:
+    """Serialize a log event to a JSON string."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, default=str)
+
+
+class JSONFormatter(logging.Formatter):
+    """Render records as one JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format the record as JSON."""
+        entry: dict[str, Any] = {
+            "timestamp": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            "level": record.levelname,
+            "name": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS:
+                entry[key] = value
+        return _dumps(entry)
+
 
 def setup_logging() -> structlog.BoundLogger:
     """Set up structured logging."""
+    global _listener
     # Configure Python logging
     log_level = getattr(logging, settings.log_level.upper())
 
     # Create formatter based on environment
     formatter: logging.Formatter
     if settings.log_format == "json":
-        formatter = jsonlogger.JsonFormatter(
-            "%(timestamp)s %(level)s %(name)s %(message)s",
-            timestamp=True,
-        )
+        formatter = JSONFormatter()
     else:
         formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 
@@ -31,40 +71,56 @@ def setup_logging() -> structlog.BoundLogger:
     root_logger.setLevel(log_level)
 
     # Remove existing handlers
+    stop_logging()
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
 
-    # Add console handler
+    # Log calls only format and enqueue; a listener thread does the blocking write.
+    # Records are formatted by the queue handler, so the console handler just
+    # writes the prepared message.
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(formatter)
+    root_logger.addHandler(queue_handler)
+
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    console_handler.setFormatter(logging.Formatter("%(message)s"))
+    _listener = logging.handlers.QueueListener(log_queue, console_handler)
+    _listener.start()
 
-    # Configure structlog
-    structlog.configure(
-        processors=[
-            structlog.stdlib.filter_by_level,
-            structlog.stdlib.add_logger_name,
-            structlog.stdlib.add_log_level,
-            structlog.stdlib.PositionalArgumentsFormatter(),
-            structlog.processors.TimeStamper(fmt="iso"),
-            structlog.processors.StackInfoRenderer(),
-            structlog.processors.format_exc_info,
-            structlog.processors.UnicodeDecoder(),
-            structlog.processors.dict_tracebacks,
+    processors: list[structlog.types.Processor] = [
+        structlog.stdlib.add_logger_name,
+        structlog.stdlib.add_log_level,
+        structlog.stdlib.PositionalArgumentsFormatter(),
+        structlog.processors.TimeStamper(fmt="iso"),
+        structlog.processors.StackInfoRenderer(),
+        structlog.processors.format_exc_info,
+        structlog.processors.UnicodeDecoder(),
+    ]
+    if settings.is_development:
+        # Walks the stack on every call; only worth it while developing
+        processors.append(
             structlog.processors.CallsiteParameterAdder(
                 parameters=[
                     structlog.processors.CallsiteParameter.FILENAME,
                     structlog.processors.CallsiteParameter.LINENO,
                     structlog.processors.CallsiteParameter.FUNC_NAME,
                 ]
-            ),
-            structlog.processors.EventRenamer("message"),
-            (
-                structlog.processors.JSONRenderer()
-                if settings.log_format == "json"
-                else structlog.dev.ConsoleRenderer(colors=settings.is_development)
-            ),
-        ],
+            )
+        )
+    processors += [
+        structlog.processors.EventRenamer("message"),
+        (
+            structlog.processors.JSONRenderer(serializer=_dumps)
+            if settings.log_format == "json"
+            else structlog.dev.ConsoleRenderer(colors=settings.is_development)
+        ),
+    ]
+
+    # Configure structlog; calls below log_level return before any processor runs
+    structlog.configure(
+        processors=processors,
+        wrapper_class=structlog.make_filtering_bound_logger(log_level),
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
@@ -72,3 +128,24 @@ def setup_logging() -> structlog.BoundLogger:
 
     # Return configured logger
     return structlog.get_logger()  # type: ignore[no-any-return]
+
+
+def stop_logging() -> None:
+    """Flush queued log records and write synchronously from here on.
+
+    Called on shutdown so records logged after the listener stops are not left
+    on the queue.
+    """
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    _listener = None
+
+    root_logger = logging.getLogger()
+    for handler in root_logger.handlers[:]:
+        if isinstance(handler, logging.handlers.QueueHandler):
+            root_logger.removeHandler(handler)
+            console_handler = logging.StreamHandler(sys.stdout)
+            console_handler.setFormatter(handler.formatter)
+            root_logger.addHandler(console_handler)
@@ -1,17 +1,27 @@
 """Command-line interface for netbox-geo."""
 
 import sys
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
 import click
-from loguru import logger
-from rich.console import Console
-from rich.table import Table
 
 from netbox_geo import __version__
-from netbox_geo.core.config import get_settings
 from netbox_geo.core.exceptions import NetBoxGeoError
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# rich, loguru and the pydantic settings stack are imported inside the commands
+# that use them, so `--help` and `--version` start without loading them.
+
+
+@lru_cache(maxsize=1)
+def get_console() -> "Console":
+    """Get the shared rich console."""
+    from rich.console import Console
+
+    return Console()
 
 
 @click.group()
@@ -34,6 +44,8 @@ def cli(verbose: bool, debug: bool) -> None:
     Enterprise FOSS tool for integrating geographic data from GeoNames,
     Natural Earth, and OpenStreetMap with NetBox.
     """
+    from loguru import logger
+
     # Configure logging
     log_level = "DEBUG" if debug else ("INFO" if verbose else "WARNING")
     logger.remove()
@@ -64,6 +76,11 @@ def import_data(source: str, batch_size: int | None, dry_run: bool) -> None:
     Import countries, regions, and cities from GeoNames, Natural Earth,
     and OpenStreetMap into NetBox.
     """
+    from loguru import logger
+
+    from netbox_geo.core.config import get_settings
+
+    console = get_console()
     try:
         get_settings()  # Validate settings are available
 
@@ -100,6 +117,11 @@ def sync(endpoint: str | None, force: bool) -> None:
 
     Update NetBox with the latest geographic data from cached sources.
     """
+    from loguru import logger
+
+    from netbox_geo.core.config import get_settings
+
+    console = get_console()
     try:
         get_settings()  # Validate settings are available
 
@@ -133,6 +155,10 @@ def validate(source: str) -> None:
 
     Check for data inconsistencies, missing references, and validation errors.
     """
+    from loguru import logger
+    from rich.table import Table
+
+    console = get_console()
     try:
         console.print(f"[bold blue]Validating {source} data...[/bold blue]")
 
@@ -174,6 +200,11 @@ def config(show: bool, test: bool) -> None:
 
     Display or test the current configuration.
     """
+    from loguru import logger
+
+    from netbox_geo.core.config import get_settings
+
+    console = get_console()
     try:
         settings = get_settings()
 
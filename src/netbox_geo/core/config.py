@@ -14,6 +14,9 @@ class NetBoxConfig(BaseSettings):
     verify_ssl: bool = Field(True, description="Verify SSL certificates")
     timeout: int = Field(30, description="Request timeout in seconds", ge=1, le=300)
     max_retries: int = Field(3, description="Maximum number of retries", ge=0, le=10)
+    retry_max_wait: float = Field(
+        30.0, description="Maximum backoff between retries in seconds", gt=0, le=300
+    )
     api_version: str = Field("4.4", description="NetBox API version")
 
     model_config = SettingsConfigDict(
@@ -1,15 +1,33 @@
 """Custom exceptions for NetBox Geographic Data Integration."""
 
+from typing import Any
+
 
 class NetBoxGeoError(Exception):
-    """Base exception for all netbox-geo errors."""
+    """Base exception for all netbox-geo errors.
 
-    pass
+    Subclasses declare their attributes in ``__slots__`` so raising them does
+    not allocate an instance ``__dict__``.
+    """
+
+    __slots__ = ()
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickle slot attributes, which BaseException only saves from __dict__."""
+        state = {
+            name: getattr(self, name)
+            for cls in type(self).__mro__
+            for name in getattr(cls, "__slots__", ())
+            if hasattr(self, name)
+        }
+        return type(self), self.args, state
 
 
 class NetBoxAPIError(NetBoxGeoError):
     """Exception raised for NetBox API errors."""
 
+    __slots__ = ("message", "status_code")
+
     def __init__(self, message: str, status_code: int | None = None) -> None:
         """Initialize NetBoxAPIError.
 
@@ -25,6 +43,8 @@ class NetBoxAPIError(NetBoxGeoError):
 class RateLimitError(NetBoxGeoError):
     """Exception raised when rate limit is exceeded."""
 
+    __slots__ = ("message", "retry_after")
+
     def __init__(
         self, message: str = "Rate limit exceeded", retry_after: float | None = None
     ) -> None:
@@ -42,6 +62,8 @@ class RateLimitError(NetBoxGeoError):
 class DataValidationError(NetBoxGeoError):
     """Exception raised for data validation errors."""
 
+    __slots__ = ("message", "field")
+
     def __init__(self, message: str, field: str | None = None) -> None:
         """Initialize DataValidationError.
 
@@ -54,13 +76,15 @@ class DataValidationError(NetBoxGeoError):
         super().__init__(self.message)
 
 
-class ImportError(NetBoxGeoError):
+class DataImportError(NetBoxGeoError):
     """Exception raised during data import operations."""
 
+    __slots__ = ("message", "source", "record_id")
+
     def __init__(
         self, message: str, source: str | None = None, record_id: str | None = None
     ) -> None:
-        """Initialize ImportError.
+        """Initialize DataImportError.
 
         Args:
             message: Error message describing the import error.
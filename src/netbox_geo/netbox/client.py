@@ -1,30 +1,125 @@
 """NetBox API client with rate limiting and retry logic."""
 
+import asyncio
+import random
+import threading
 import time
+from functools import reduce
+from importlib.util import find_spec
 from typing import Any
 
+import httpx
 import pynetbox
+import requests
 from loguru import logger
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
 
 from netbox_geo.core.config import NetBoxConfig
-from netbox_geo.core.exceptions import NetBoxAPIError
+from netbox_geo.core.exceptions import NetBoxAPIError, RateLimitError
 from netbox_geo.netbox.rate_limiter import RateLimiter
 
+# HTTP/2 needs the optional h2 package (httpx[http2])
+HTTP2_AVAILABLE = find_spec("h2") is not None
+
+# Status codes worth retrying; other errors are returned to the caller as-is
+RETRY_STATUS_CODES = frozenset({408, 429, 502, 503, 504})
+
+# Objects per bulk request; keeps request bodies well under NetBox's upload limit
+BULK_BATCH_SIZE = 500
+
+# Requests in flight at once; the token bucket limits rate, not parallelism, so
+# a full bucket could otherwise open that many connections to NetBox together
+MAX_CONCURRENT_REQUESTS = 10
+
+
+def backoff_delay(attempt: int, max_wait: float) -> float:
+    """Get a full-jitter exponential backoff delay.
+
+    Randomizing over the whole window keeps clients that failed together from
+    retrying in lock-step.
+
+    Args:
+        attempt: Zero-based attempt number.
+        max_wait: Upper bound for the backoff window in seconds.
+
+    Returns:
+        Seconds to wait before the next attempt.
+    """
+    return random.uniform(0, min(max_wait, 2**attempt))
+
+
+def retry_delay(headers: Any, attempt: int, max_wait: float) -> float:
+    """Get the delay before retrying a failed response.
+
+    A ``Retry-After`` header given in seconds (sent with 429 and 503) is
+    honoured, capped at ``max_wait``; otherwise fall back to ``backoff_delay``.
+
+    Args:
+        headers: Response headers.
+        attempt: Zero-based attempt number.
+        max_wait: Upper bound for the delay in seconds.
+
+    Returns:
+        Seconds to wait before the next attempt.
+    """
+    try:
+        return min(max_wait, max(0.0, float(headers["Retry-After"])))
+    except (KeyError, ValueError):
+        return backoff_delay(attempt, max_wait)
+
 
 class NetBoxClient:
     """NetBox API client with enhanced error handling and rate limiting."""
 
-    def __init__(self, config: NetBoxConfig, rate_limit_calls_per_minute: int = 100) -> None:
+    def __init__(
+        self,
+        config: NetBoxConfig,
+        rate_limit_calls_per_minute: int = 100,
+        max_concurrent: int = MAX_CONCURRENT_REQUESTS,
+    ) -> None:
         """Initialize NetBox client.
 
         Args:
             config: NetBox configuration.
             rate_limit_calls_per_minute: Maximum API calls per minute.
+            max_concurrent: Maximum requests in flight at once across threads.
         """
         self.config = config
+        self.rate_limit_calls_per_minute = rate_limit_calls_per_minute
         self.rate_limiter = RateLimiter(calls_per_minute=rate_limit_calls_per_minute)
+        self._semaphore = threading.BoundedSemaphore(max_concurrent)
+        self._session = self._create_session()
         self._client = self._create_client()
+        self._endpoint_cache: dict[str, Any] = {}
+
+    def _create_session(self) -> requests.Session:
+        """Create the HTTP session shared by all NetBox calls.
+
+        Every call goes to the same host, so one adapter keeps a pool of
+        keep-alive connections instead of handshaking per request. Retries are
+        left to ``_retry_with_backoff``.
+
+        Returns:
+            Configured requests session.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=max(20, self.rate_limit_calls_per_minute // 3),
+            pool_block=False,
+            max_retries=0,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        if not self.config.verify_ssl:
+            import urllib3
+
+            urllib3.disable_warnings()
+            session.verify = False
+
+        return session
 
     def _create_client(self) -> pynetbox.api:
         """Create pynetbox API client.
@@ -40,22 +135,43 @@ class NetBoxClient:
                 url=self.config.url,
                 token=self.config.token,
             )
-            # Configure SSL verification
-            if not self.config.verify_ssl:
-                import urllib3
-
-                urllib3.disable_warnings()
-                api.http_session.verify = False
+            api.http_session = self._session
 
             return api
         except Exception as e:
             logger.error(f"Failed to create NetBox client: {e}")
             raise NetBoxAPIError(f"Failed to create NetBox client: {e}")
 
+    def _endpoint(self, endpoint: str) -> Any:
+        """Resolve and cache a pynetbox endpoint such as ``dcim.sites``.
+
+        pynetbox builds a new Endpoint object on every attribute access.
+
+        Args:
+            endpoint: Dotted endpoint name.
+
+        Returns:
+            pynetbox Endpoint (or App) object.
+
+        Raises:
+            NetBoxAPIError: If the endpoint does not exist.
+        """
+        endpoint_obj = self._endpoint_cache.get(endpoint)
+        if endpoint_obj is None:
+            try:
+                endpoint_obj = reduce(getattr, endpoint.split("."), self._client)
+            except AttributeError:
+                raise NetBoxAPIError(f"Invalid endpoint: {endpoint}")
+            self._endpoint_cache[endpoint] = endpoint_obj
+        return endpoint_obj
+
     def _retry_with_backoff(
         self, func: Any, *args: Any, max_retries: int | None = None, **kwargs: Any
     ) -> Any:
-        """Execute function with exponential backoff retry logic.
+        """Execute function with jittered exponential backoff retry logic.
+
+        This blocks the calling thread while waiting; use ``AsyncNetBoxClient``
+        from async code.
 
         Args:
             func: Function to execute.
@@ -77,26 +193,27 @@ class NetBoxClient:
                 # Acquire rate limit token
                 self.rate_limiter.acquire()
 
-                # Execute the function
-                return func(*args, **kwargs)
-
-            except pynetbox.core.query.RequestError as e:
+                # Execute the function; backoff sleeps happen outside the semaphore
+                with self._semaphore:
+                    return func(*args, **kwargs)
+
+            except (pynetbox.core.query.RequestError, RequestException) as e:
+                # Connection errors carry no response and are always retried. Error
+                # responses are falsy, so test against None rather than truthiness.
+                response = getattr(e, "req", None)
+                if response is None:
+                    response = getattr(e, "response", None)
+                if response is not None and response.status_code not in RETRY_STATUS_CODES:
+                    raise NetBoxAPIError(
+                        f"NetBox API request failed: {e}", status_code=response.status_code
+                    )
                 last_exception = e
                 logger.warning(f"NetBox API request failed (attempt {attempt + 1}): {e}")
 
                 if attempt < retries:
-                    wait_time = 2**attempt  # Exponential backoff: 1, 2, 4, 8...
-                    logger.info(f"Retrying in {wait_time} seconds...")
-                    time.sleep(wait_time)
-                else:
-                    logger.error(f"Max retries ({retries}) exhausted")
-
-            except RequestException as e:
-                last_exception = e
-                logger.warning(f"Request exception (attempt {attempt + 1}): {e}")
-
-                if attempt < retries:
-                    wait_time = 2**attempt
+                    headers = response.headers if response is not None else {}
+                    wait_time = retry_delay(headers, attempt, self.config.retry_max_wait)
+                    logger.info(f"Retrying in {wait_time:.2f} seconds...")
                     time.sleep(wait_time)
                 else:
                     logger.error(f"Max retries ({retries}) exhausted")
@@ -122,11 +239,8 @@ class NetBoxClient:
         Raises:
             NetBoxAPIError: If the request fails.
         """
-        try:
-            endpoint_obj = getattr(self._client, endpoint)
-            return self._retry_with_backoff(endpoint_obj.all, **params)
-        except AttributeError:
-            raise NetBoxAPIError(f"Invalid endpoint: {endpoint}")
+        endpoint_obj = self._endpoint(endpoint)
+        return self._retry_with_backoff(endpoint_obj.all, **params)
 
     def create(self, endpoint: str, data: dict[str, Any]) -> Any:
         """Create a new object in NetBox.
@@ -141,18 +255,20 @@ class NetBoxClient:
         Raises:
             NetBoxAPIError: If the creation fails.
         """
-        try:
-            endpoint_obj = getattr(self._client, endpoint)
-            return self._retry_with_backoff(endpoint_obj.create, data)
-        except AttributeError:
-            raise NetBoxAPIError(f"Invalid endpoint: {endpoint}")
+        endpoint_obj = self._endpoint(endpoint)
+        return self._retry_with_backoff(endpoint_obj.create, data)
 
-    def bulk_create(self, endpoint: str, data: list[dict[str, Any]]) -> list[Any]:
+    def bulk_create(
+        self, endpoint: str, data: list[dict[str, Any]], batch_size: int = BULK_BATCH_SIZE
+    ) -> list[Any]:
         """Bulk create objects in NetBox.
 
+        Each batch is posted as a single list request.
+
         Args:
             endpoint: API endpoint.
             data: List of object data dictionaries.
+            batch_size: Maximum objects per request.
 
         Returns:
             List of created objects.
@@ -160,15 +276,16 @@ class NetBoxClient:
         Raises:
             NetBoxAPIError: If the bulk creation fails.
         """
-        try:
-            endpoint_obj = getattr(self._client, endpoint)
-            result = self._retry_with_backoff(endpoint_obj.create, data)
-            return result  # type: ignore[no-any-return]
-        except AttributeError:
-            raise NetBoxAPIError(f"Invalid endpoint: {endpoint}")
+        endpoint_obj = self._endpoint(endpoint)
+        created: list[Any] = []
+        for start in range(0, len(data), batch_size):
+            created.extend(
+                self._retry_with_backoff(endpoint_obj.create, data[start : start + batch_size])
+            )
+        return created
 
     def update(self, endpoint: str, obj_id: int, data: dict[str, Any]) -> Any:
-        """Update an existing object in NetBox.
+        """Update an existing object in NetBox with a single PATCH request.
 
         Args:
             endpoint: API endpoint.
@@ -181,14 +298,26 @@ class NetBoxClient:
         Raises:
             NetBoxAPIError: If the update fails.
         """
-        try:
-            endpoint_obj = getattr(self._client, endpoint)
-            obj = self._retry_with_backoff(endpoint_obj.get, obj_id)
-            for key, value in data.items():
-                setattr(obj, key, value)
-            return self._retry_with_backoff(obj.save)
-        except AttributeError:
-            raise NetBoxAPIError(f"Invalid endpoint: {endpoint}")
+        return self.bulk_update(endpoint, [{"id": obj_id, **data}])[0]
+
+    def bulk_update(self, endpoint: str, data: list[dict[str, Any]]) -> list[Any]:
+        """Update objects in NetBox with a single PATCH request.
+
+        Only the given fields are sent; the objects are not fetched first.
+
+        Args:
+            endpoint: API endpoint.
+            data: List of changed fields per object, each including its ``id``.
+
+        Returns:
+            List of updated objects.
+
+        Raises:
+            NetBoxAPIError: If the update fails.
+        """
+        endpoint_obj = self._endpoint(endpoint)
+        result = self._retry_with_backoff(endpoint_obj.update, data)
+        return result  # type: ignore[no-any-return]
 
     def delete(self, endpoint: str, obj_id: int) -> bool:
         """Delete an object from NetBox.
@@ -203,12 +332,13 @@ class NetBoxClient:
         Raises:
             NetBoxAPIError: If the deletion fails.
         """
-        try:
-            endpoint_obj = getattr(self._client, endpoint)
-            obj = self._retry_with_backoff(endpoint_obj.get, obj_id)
-            return self._retry_with_backoff(obj.delete)  # type: ignore[no-any-return]
-        except AttributeError:
-            raise NetBoxAPIError(f"Invalid endpoint: {endpoint}")
+        endpoint_obj = self._endpoint(endpoint)
+        obj = self._retry_with_backoff(endpoint_obj.get, obj_id)
+        return self._retry_with_backoff(obj.delete)  # type: ignore[no-any-return]
+
+    def close(self) -> None:
+        """Close pooled connections to NetBox."""
+        self._session.close()
 
     @property
     def client(self) -> pynetbox.api:
@@ -218,3 +348,218 @@ class NetBoxClient:
             pynetbox API instance.
         """
         return self._client
+
+
+class AsyncNetBoxClient:
+    """Asynchronous NetBox REST client for issuing many calls concurrently.
+
+    All calls share one ``httpx.AsyncClient``, so ``asyncio.gather`` over many
+    requests reuses keep-alive connections (multiplexed over HTTP/2 when ``h2``
+    is installed) instead of paying one round trip after another.
+    """
+
+    def __init__(
+        self,
+        config: NetBoxConfig,
+        rate_limit_calls_per_minute: int = 100,
+        max_concurrent: int = MAX_CONCURRENT_REQUESTS,
+    ) -> None:
+        """Initialize asynchronous NetBox client.
+
+        Args:
+            config: NetBox configuration.
+            rate_limit_calls_per_minute: Maximum API calls per minute.
+            max_concurrent: Maximum requests in flight at once.
+        """
+        self.config = config
+        self.rate_limiter = RateLimiter(calls_per_minute=rate_limit_calls_per_minute)
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._client = self._create_client()
+
+    def _create_client(self) -> httpx.AsyncClient:
+        """Create the shared HTTP client.
+
+        Returns:
+            Configured httpx client rooted at the NetBox API.
+        """
+        return httpx.AsyncClient(
+            base_url=f"{self.config.url}/api/",
+            headers={
+                "Authorization": f"Token {self.config.token}",
+                "Accept": "application/json",
+            },
+            verify=self.config.verify_ssl,
+            timeout=self.config.timeout,
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        )
+
+    async def _acquire(self) -> None:
+        """Wait for a rate limit token without blocking the event loop."""
+        while True:
+            try:
+                self.rate_limiter.acquire(blocking=False)
+                return
+            except RateLimitError as e:
+                await asyncio.sleep(e.retry_after or 0)
+
+    async def _request(self, method: str, path: str, **kwargs: Any) -> Any:
+        """Send a request with exponential backoff retry logic.
+
+        Args:
+            method: HTTP method.
+            path: Path relative to the API root, or an absolute URL.
+            **kwargs: Arguments passed to ``httpx.AsyncClient.request``.
+
+        Returns:
+            Decoded JSON response, or None for empty responses.
+
+        Raises:
+            NetBoxAPIError: If the request fails or all retries are exhausted.
+        """
+        retries = self.config.max_retries
+        last_exception: Exception | None = None
+        headers: Any = {}
+
+        for attempt in range(retries + 1):
+            await self._acquire()
+            try:
+                async with self._semaphore:
+                    response = await self._client.request(method, path, **kwargs)
+                response.raise_for_status()
+                return response.json() if response.content else None
+
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code not in RETRY_STATUS_CODES:
+                    raise NetBoxAPIError(
+                        f"NetBox API request failed: {e.response.text}",
+                        status_code=e.response.status_code,
+                    )
+                last_exception = e
+                headers = e.response.headers
+                logger.warning(f"NetBox API request failed (attempt {attempt + 1}): {e}")
+
+            except httpx.TransportError as e:
+                last_exception = e
+                headers = {}
+                logger.warning(f"Request exception (attempt {attempt + 1}): {e}")
+
+            if attempt < retries:
+                await asyncio.sleep(retry_delay(headers, attempt, self.config.retry_max_wait))
+            else:
+                logger.error(f"Max retries ({retries}) exhausted")
+
+        raise NetBoxAPIError(f"Failed after {retries} retries: {last_exception}")
+
+    @staticmethod
+    def _path(endpoint: str) -> str:
+        """Convert ``dcim.sites`` or ``dcim/sites`` to an API path.
+
+        Args:
+            endpoint: API endpoint.
+
+        Returns:
+            Path relative to the API root.
+        """
+        return endpoint.strip("/").replace(".", "/") + "/"
+
+    async def aget(self, endpoint: str, **params: Any) -> list[Any]:
+        """Get all objects from a NetBox endpoint, following pagination.
+
+        Args:
+            endpoint: API endpoint to query.
+            **params: Query parameters.
+
+        Returns:
+            List of objects.
+
+        Raises:
+            NetBoxAPIError: If the request fails.
+        """
+        page = await self._request("GET", self._path(endpoint), params=params)
+        results: list[Any] = list(page["results"])
+        while page.get("next"):
+            page = await self._request("GET", page["next"])
+            results.extend(page["results"])
+        return results
+
+    async def acreate(self, endpoint: str, data: dict[str, Any]) -> Any:
+        """Create a new object in NetBox.
+
+        Args:
+            endpoint: API endpoint.
+            data: Object data.
+
+        Returns:
+            Created object.
+
+        Raises:
+            NetBoxAPIError: If the creation fails.
+        """
+        return await self._request("POST", self._path(endpoint), json=data)
+
+    async def abulk_create(
+        self, endpoint: str, data: list[dict[str, Any]], batch_size: int = BULK_BATCH_SIZE
+    ) -> list[Any]:
+        """Bulk create objects in NetBox, one request per batch.
+
+        Args:
+            endpoint: API endpoint.
+            data: List of object data dictionaries.
+            batch_size: Maximum objects per request.
+
+        Returns:
+            List of created objects.
+
+        Raises:
+            NetBoxAPIError: If the bulk creation fails.
+        """
+        path = self._path(endpoint)
+        created: list[Any] = []
+        for start in range(0, len(data), batch_size):
+            created.extend(await self._request("POST", path, json=data[start : start + batch_size]))
+        return created
+
+    async def aupdate(self, endpoint: str, obj_id: int, data: dict[str, Any]) -> Any:
+        """Update an existing object in NetBox with a single PATCH.
+
+        Args:
+            endpoint: API endpoint.
+            obj_id: Object ID.
+            data: Updated object data.
+
+        Returns:
+            Updated object.
+
+        Raises:
+            NetBoxAPIError: If the update fails.
+        """
+        return await self._request("PATCH", f"{self._path(endpoint)}{obj_id}/", json=data)
+
+    async def adelete(self, endpoint: str, obj_id: int) -> bool:
+        """Delete an object from NetBox.
+
+        Args:
+            endpoint: API endpoint.
+            obj_id: Object ID.
+
+        Returns:
+            True if deletion was successful.
+
+        Raises:
+            NetBoxAPIError: If the deletion fails.
+        """
+        await self._request("DELETE", f"{self._path(endpoint)}{obj_id}/")
+        return True
+
+    async def aclose(self) -> None:
+        """Close pooled connections to NetBox."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncNetBoxClient":
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        """Async context manager exit."""
+        await self.aclose()
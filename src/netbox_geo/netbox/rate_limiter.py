@@ -8,27 +8,56 @@ from netbox_geo.core.exceptions import RateLimitError
 
 
 class RateLimiter:
-    """Token bucket rate limiter for API calls."""
+    """Token bucket rate limiter for API calls.
+
+    The bucket is stored as a single "zero time": the moment it was (or will
+    be) empty. The available tokens follow from the clock, so there is no
+    separate refill step, and a blocking caller reserves its tokens up front
+    and then sleeps without taking the lock again.
+    """
+
+    __slots__ = (
+        "calls_per_minute",
+        "max_tokens",
+        "refill_rate",
+        "_seconds_per_token",
+        "_zero_time",
+        "_lock",
+    )
 
     def __init__(self, calls_per_minute: int = 100) -> None:
         """Initialize the rate limiter.
 
         Args:
             calls_per_minute: Maximum number of API calls allowed per minute.
+
+        Raises:
+            ValueError: If calls_per_minute is not positive.
         """
+        if calls_per_minute <= 0:
+            raise ValueError("calls_per_minute must be positive")
+
         self.calls_per_minute = calls_per_minute
-        self.tokens = float(calls_per_minute)
         self.max_tokens = float(calls_per_minute)
         self.refill_rate = calls_per_minute / 60.0  # tokens per second
-        self.last_refill = time.time()
+        self._seconds_per_token = 60.0 / calls_per_minute
+        # Start with a full bucket
+        self._zero_time = time.monotonic() - self.max_tokens * self._seconds_per_token
         self._lock = Lock()
 
-    def _refill(self) -> None:
-        """Refill tokens based on elapsed time."""
-        now = time.time()
-        elapsed = now - self.last_refill
-        self.tokens = min(self.max_tokens, self.tokens + elapsed * self.refill_rate)
-        self.last_refill = now
+    def _available(self, now: float) -> float:
+        """Get the tokens available at ``now``; negative while paying back a reservation."""
+        return min(self.max_tokens, (now - self._zero_time) * self.refill_rate)
+
+    @property
+    def tokens(self) -> float:
+        """Get the number of tokens currently available."""
+        return self._available(time.monotonic())
+
+    @tokens.setter
+    def tokens(self, value: float) -> None:
+        """Set the number of tokens currently available."""
+        self._zero_time = time.monotonic() - value * self._seconds_per_token
 
     def acquire(self, tokens: int = 1, blocking: bool = True) -> bool:
         """Acquire tokens for an API call.
@@ -44,38 +73,45 @@ class RateLimiter:
             RateLimitError: If tokens cannot be acquired in non-blocking mode.
         """
         with self._lock:
-            self._refill()
-
-            if self.tokens >= tokens:
-                self.tokens -= tokens
-                return True
+            now = time.monotonic()
+            available = self._available(now)
+            wait_time = (tokens - available) * self._seconds_per_token
 
-            if not blocking:
-                retry_after = (tokens - self.tokens) / self.refill_rate
+            if wait_time > 0 and not blocking:
                 raise RateLimitError(
-                    f"Rate limit exceeded. Retry after {retry_after:.2f} seconds.",
-                    retry_after=retry_after,
+                    f"Rate limit exceeded. Retry after {wait_time:.2f} seconds.",
+                    retry_after=wait_time,
                 )
 
-            # Calculate wait time
-            wait_time = (tokens - self.tokens) / self.refill_rate
+            # Take the tokens now; when short, this reserves them ahead of later callers.
+            # The bucket is empty again once the wait (negative if none) has passed.
+            self._zero_time = now + wait_time
 
-        # Wait outside the lock
-        time.sleep(wait_time)
+        if wait_time > 0:
+            # Wait outside the lock
+            time.sleep(wait_time)
+        return True
 
+    def release(self, tokens: int = 1) -> None:
+        """Return tokens to the bucket, e.g. when the guarded call failed.
+
+        Args:
+            tokens: Number of tokens to return.
+        """
         with self._lock:
-            self._refill()
-            self.tokens -= tokens
-            return True
+            # Never refill past a full bucket
+            full_at = time.monotonic() - self.max_tokens * self._seconds_per_token
+            self._zero_time = max(full_at, self._zero_time - tokens * self._seconds_per_token)
 
     def __enter__(self) -> "RateLimiter":
         """Context manager entry."""
         self.acquire()
         return self
 
-    def __exit__(self, *args: Any) -> None:
-        """Context manager exit."""
-        pass
+    def __exit__(self, exc_type: Any, *args: Any) -> None:
+        """Context manager exit; refunds the token if the block raised."""
+        if exc_type is not None:
+            self.release()
 
 
 def rate_limit(calls_per_minute: int = 100) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
@@ -94,8 +130,8 @@ def rate_limit(calls_per_minute: int = 100) -> Callable[[Callable[..., Any]], Ca
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            limiter.acquire()
-            return func(*args, **kwargs)
+            with limiter:
+                return func(*args, **kwargs)
 
         return wrapper
 
@@ -1,21 +1,34 @@
 """Version information utilities."""
 
 import os
-from datetime import datetime
+from collections.abc import Mapping
+from datetime import datetime, timezone
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
 from src.core.config import get_settings
 
 settings = get_settings()
 
+# Fallback build date for local runs: when this process started
+STARTED_AT = datetime.now(timezone.utc).replace(tzinfo=None).isoformat()
 
-def get_version_info() -> dict[str, Any]:
-    """Get detailed version information."""
-    return {
-        "version": settings.app_version,
-        "environment": settings.environment,
-        "commit_sha": os.getenv("COMMIT_SHA", "unknown"),
-        "build_date": os.getenv("BUILD_DATE", datetime.utcnow().isoformat()),
-        "build_number": os.getenv("BUILD_NUMBER", "local"),
-        "api_version": "v1",
-    }
+
+@lru_cache(maxsize=1)
+def get_version_info() -> Mapping[str, Any]:
+    """Get detailed version information.
+
+    The result is fixed for the lifetime of the process and computed once; it is
+    returned read-only because every caller shares the same mapping.
+    """
+    return MappingProxyType(
+        {
+            "version": settings.app_version,
+            "environment": settings.environment,
+            "commit_sha": os.getenv("COMMIT_SHA", "unknown"),
+            "build_date": os.getenv("BUILD_DATE", STARTED_AT),
+            "build_number": os.getenv("BUILD_NUMBER", "local"),
+            "api_version": "v1",
+        }
+    )
@@ -1,19 +1,18 @@
 """Pytest configuration and fixtures."""
 
 import asyncio
-import os
+from pathlib import Path
 from typing import AsyncGenerator, Generator
 
 import pytest
 import pytest_asyncio
 from fastapi.testclient import TestClient
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.pool import StaticPool
 
 from src.api.main import app
 from src.core.config import Settings, get_settings
-from src.core.database import Base, get_db
+from src.core.database import Base, get_db, get_read_db
 
 
 # Override settings for testing
@@ -44,6 +43,7 @@ async def test_engine(test_settings):
     engine = create_async_engine(
         str(test_settings.database_url),
         poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
         echo=test_settings.database_echo,
     )
 
@@ -58,16 +58,16 @@ async def test_engine(test_settings):
     await engine.dispose()
 
 
+@pytest.fixture(scope="session")
+def session_factory(test_engine) -> async_sessionmaker[AsyncSession]:
+    """Create the test session factory once for the whole run."""
+    return async_sessionmaker(test_engine, expire_on_commit=False)
+
+
 @pytest_asyncio.fixture
-async def test_session(test_engine) -> AsyncGenerator[AsyncSession, None]:
+async def test_session(session_factory) -> AsyncGenerator[AsyncSession, None]:
     """Create test database session."""
-    TestSessionLocal = sessionmaker(
-        test_engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-    )
-
-    async with TestSessionLocal() as session:
+    async with session_factory() as session:
         yield session
         await session.rollback()
 
@@ -78,6 +78,7 @@ def client(test_session, test_settings) -> Generator[TestClient, None, None]:
     # Override dependencies
     app.dependency_overrides[get_settings] = lambda: test_settings
     app.dependency_overrides[get_db] = lambda: test_session
+    app.dependency_overrides[get_read_db] = lambda: test_session
 
     with TestClient(app) as test_client:
         yield test_client
@@ -86,9 +87,32 @@ def client(test_session, test_settings) -> Generator[TestClient, None, None]:
     app.dependency_overrides.clear()
 
 
-@pytest.fixture
-def auth_headers(client) -> dict[str, str]:
-    """Create authenticated headers."""
+@pytest.fixture(scope="session")
+def auth_headers(session_factory, test_settings) -> dict[str, str]:
+    """Create authenticated headers once for the whole run.
+
+    The user is committed through its own session, so it outlives the
+    per-test sessions that roll back.
+    """
+
+    async def setup_db() -> AsyncGenerator[AsyncSession, None]:
+        async with session_factory() as session:
+            yield session
+            await session.commit()
+
+    app.dependency_overrides[get_settings] = lambda: test_settings
+    app.dependency_overrides[get_db] = setup_db
+    app.dependency_overrides[get_read_db] = setup_db
+
+    try:
+        with TestClient(app) as setup_client:
+            return register_and_login(setup_client)
+    finally:
+        app.dependency_overrides.clear()
+
+
+def register_and_login(client: TestClient) -> dict[str, str]:
+    """Register the test user and return bearer headers for it."""
     # Create test user and get token
     response = client.post(
         "/api/v1/auth/register",
@@ -114,24 +138,13 @@ def auth_headers(client) -> dict[str, str]:
     return {"Authorization": f"Bearer {token}"}
 
 
-@pytest.fixture(autouse=True)
-def reset_test_data():
-    """Reset test data before each test."""
-    # Clear any test files
-    test_upload_dir = "/tmp/test_uploads"
-    if os.path.exists(test_upload_dir):
-        import shutil
-
-        shutil.rmtree(test_upload_dir)
-    os.makedirs(test_upload_dir, exist_ok=True)
-
-    yield
-
-    # Cleanup after test
-    if os.path.exists(test_upload_dir):
-        import shutil
-
-        shutil.rmtree(test_upload_dir)
+@pytest.fixture
+def upload_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Create an isolated upload directory and point UPLOAD_DIR at it."""
+    directory = tmp_path / "uploads"
+    directory.mkdir()
+    monkeypatch.setenv("UPLOAD_DIR", str(directory))
+    return directory
 
 
 # Markers
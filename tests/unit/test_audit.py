@@ -0,0 +1,96 @@
+"""Unit tests for audit log writing."""
+
+import os
+from typing import Any
+
+import pytest
+
+pytest.importorskip("django")
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.testing")
+
+from app.core import audit  # noqa: E402
+from app.core.models import Role  # noqa: E402
+
+
+@pytest.fixture
+def written(monkeypatch: pytest.MonkeyPatch) -> list[list[dict[str, Any]]]:
+    """Record committed batches; a batch containing a ``bad`` row fails."""
+    batches: list[list[dict[str, Any]]] = []
+
+    def insert_rows(batch: list[dict[str, Any]]) -> None:
+        if any(row.get("bad") for row in batch):
+            raise ValueError("invalid input syntax for type uuid")
+        batches.append(batch)
+
+    monkeypatch.setattr(audit, "_insert_rows", insert_rows)
+    return batches
+
+
+def test_failed_batch_is_retried_per_row(written: list[list[dict[str, Any]]]) -> None:
+    """Test one bad row only drops itself, not the rest of the batch."""
+    audit._insert_batch([{"id": 1}, {"id": 2, "bad": True}, {"id": 3}])
+
+    assert written == [[{"id": 1}], [{"id": 3}]]
+
+
+def test_batch_raises_when_no_row_can_be_written(written: list[list[dict[str, Any]]]) -> None:
+    """Test a batch where every row fails still raises, e.g. for dead-lettering."""
+    with pytest.raises(ValueError):
+        audit._insert_batch([{"id": 1, "bad": True}, {"id": 2, "bad": True}])
+
+    assert written == []
+
+
+def test_unsaved_instance_has_no_resource_id(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test an instance without an id is logged with resource_id None, not "None"."""
+    monkeypatch.setattr(audit, "AUDIT_ENABLED", True)
+    audit_logger = audit.AuditLogger()
+    audit_logger.log_models = True
+    logged: list[dict[str, Any]] = []
+    monkeypatch.setattr(audit_logger, "log_activity", lambda **change: logged.append(change))
+
+    audit_logger.log_model_change("CREATE", Role(name="admin"))
+
+    assert logged[0]["resource_id"] is None
+
+
+class FakeRabbitMQClient:
+    """Records queue bindings and publishes; ``fail_bind`` simulates a broker error."""
+
+    def __init__(self, fail_bind: bool = False) -> None:
+        self.fail_bind = fail_bind
+        self.calls: list[tuple[str, str]] = []
+
+    def bind_queue(self, queue_name: str) -> str:
+        if self.fail_bind:
+            raise ConnectionError("broker unavailable")
+        self.calls.append(("bind", queue_name))
+        return queue_name
+
+    def publish(self, routing_key: str, message: Any, **kwargs: Any) -> bool:
+        self.calls.append(("publish", routing_key))
+        return True
+
+
+def test_publish_binds_queue_before_first_batch(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the audit queue is bound before publishing so batches are routable."""
+    rabbitmq = pytest.importorskip("app.core.queue.rabbitmq")
+    client = FakeRabbitMQClient()
+    monkeypatch.setattr(rabbitmq, "get_rabbitmq_client", lambda: client)
+    writer = audit.AuditLogWriter(backend="rabbitmq", queue_name="audit.write")
+
+    assert writer._publish([{"id": 1}])
+    assert client.calls == [("bind", "audit.write"), ("publish", "audit.write")]
+
+
+def test_unbindable_queue_falls_back_to_database(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test a batch is written directly when the audit queue cannot be bound."""
+    rabbitmq = pytest.importorskip("app.core.queue.rabbitmq")
+    monkeypatch.setattr(rabbitmq, "get_rabbitmq_client", lambda: FakeRabbitMQClient(True))
+    direct: list[list[dict[str, Any]]] = []
+    monkeypatch.setattr(audit, "write_audit_batch", direct.append)
+    writer = audit.AuditLogWriter(backend="rabbitmq")
+
+    writer._write([{"id": 1}])
+
+    assert direct == [[{"id": 1}]]
@@ -0,0 +1,63 @@
+"""Unit tests for audit_logs partition maintenance."""
+
+from datetime import datetime, timezone
+from typing import Any
+
+from app.core.models import AUDIT_DEFAULT_PARTITION, create_audit_partitions, month_start
+
+
+class RecordingConnection:
+    """Connection that records SQL and answers the existence checks."""
+
+    def __init__(self, existing: set[str], misplaced: bool) -> None:
+        """Initialize with the partitions that exist and whether the default has rows."""
+        self.existing = existing
+        self.misplaced = misplaced
+        self.statements: list[str] = []
+
+    def execute(
+        self, statement: Any, params: dict[str, Any] | None = None
+    ) -> "RecordingConnection":
+        """Record the statement and remember its scalar answer."""
+        sql = str(statement)
+        self.statements.append(sql)
+        if sql.startswith("SELECT to_regclass"):
+            self.result = params["name"] if params and params["name"] in self.existing else None
+        elif sql.startswith("SELECT EXISTS"):
+            self.result = self.misplaced
+        return self
+
+    def scalar(self) -> Any:
+        """Return the answer to the last existence check."""
+        return self.result
+
+
+def current_partition() -> str:
+    """Get the name of this month's partition."""
+    return f"audit_logs_{month_start(datetime.now(timezone.utc)):%Y_%m}"
+
+
+def test_create_partitions_skips_existing_months() -> None:
+    """Test only missing months are created and the default stays attached."""
+    connection = RecordingConnection(existing={current_partition()}, misplaced=False)
+
+    names = create_audit_partitions(connection, months_ahead=2)
+
+    created = [sql for sql in connection.statements if sql.startswith("CREATE TABLE")]
+    assert names[0] == current_partition()
+    assert len(names) == 3
+    assert len(created) == 2
+    assert not any("DETACH" in sql for sql in connection.statements)
+
+
+def test_create_partitions_moves_rows_out_of_default() -> None:
+    """Test rows in the default partition are moved while it is detached."""
+    connection = RecordingConnection(existing=set(), misplaced=True)
+
+    create_audit_partitions(connection, months_ahead=0)
+
+    ddl = [sql for sql in connection.statements if not sql.startswith("SELECT")]
+    assert ddl[0] == f"ALTER TABLE audit_logs DETACH PARTITION {AUDIT_DEFAULT_PARTITION}"
+    assert ddl[1].startswith(f"CREATE TABLE {current_partition()} PARTITION OF audit_logs")
+    assert ddl[2].startswith(f"WITH moved AS (DELETE FROM {AUDIT_DEFAULT_PARTITION}")
+    assert ddl[3] == f"ALTER TABLE audit_logs ATTACH PARTITION {AUDIT_DEFAULT_PARTITION} DEFAULT"
@@ -0,0 +1,106 @@
+"""Unit tests for the SQLAlchemy connection manager."""
+
+from pathlib import Path
+
+import pytest
+from sqlalchemy import Column, Integer, String, event, inspect, select
+from sqlalchemy.orm import declarative_base
+
+from app.core.db import connection as connection_module
+from app.core.db.connection import DatabaseConnection, DatabaseSession
+
+# The app models need PostgreSQL; savepoint tests use a plain SQLite table
+SQLiteBase = declarative_base()
+
+
+class Item(SQLiteBase):
+    """Minimal row for transaction tests."""
+
+    __tablename__ = "items"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String(50), nullable=False)
+
+
+def make_sqlite_connection(tmp_path: Path) -> DatabaseConnection:
+    """Create a connection to a SQLite file with working SAVEPOINT support."""
+    connection = DatabaseConnection(f"sqlite:///{tmp_path / 'test.db'}")
+    connection.connect()
+
+    # pysqlite manages transactions itself; let SQLAlchemy emit BEGIN instead
+    @event.listens_for(connection.engine, "connect")
+    def disable_driver_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(connection.engine, "begin")
+    def emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    SQLiteBase.metadata.create_all(connection.engine)
+    return connection
+
+
+def stored_names(connection: DatabaseConnection) -> list[str]:
+    """Return the names committed to the items table."""
+    with connection.engine.connect() as conn:
+        return list(conn.scalars(select(Item.name).order_by(Item.id)))
+
+
+def test_nested_blocks_share_session(tmp_path: Path) -> None:
+    """Test a nested block neither closes the session nor expunges its objects."""
+    connection = make_sqlite_connection(tmp_path)
+    item = Item(name="admin")
+
+    with connection.get_session() as outer:
+        outer.add(item)
+        with connection.get_session() as inner:
+            assert inner is outer
+        assert item in outer
+        assert not inspect(item).detached
+
+    assert item not in outer
+
+
+def test_database_session_nested_in_get_session(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test DatabaseSession inside a session block keeps the caller's objects."""
+    connection = make_sqlite_connection(tmp_path)
+    monkeypatch.setattr(connection_module, "db_connection", connection)
+    item = Item(name="admin")
+
+    with connection.get_session() as outer:
+        outer.add(item)
+        with DatabaseSession() as inner:
+            assert inner is outer
+        assert item in outer
+
+
+def test_nested_commit_does_not_commit_outer_block(tmp_path: Path) -> None:
+    """Test a nested block's commit leaves the caller's work uncommitted."""
+    connection = make_sqlite_connection(tmp_path)
+
+    with connection.get_session() as outer:
+        outer.add(Item(name="outer"))
+        with connection.get_session() as inner:
+            inner.add(Item(name="inner"))
+            inner.commit()
+        outer.rollback()
+
+    assert stored_names(connection) == []
+
+
+def test_nested_exception_keeps_outer_block_work(tmp_path: Path) -> None:
+    """Test an exception in a nested block only rolls back that block."""
+    connection = make_sqlite_connection(tmp_path)
+
+    with connection.get_session() as outer:
+        outer.add(Item(name="outer"))
+        with pytest.raises(ValueError):
+            with connection.get_session() as inner:
+                inner.add(Item(name="inner"))
+                inner.flush()
+                raise ValueError("inner failure")
+        outer.commit()
+
+    assert stored_names(connection) == ["outer"]
@@ -1,8 +1,10 @@
 """Unit tests for core exceptions."""
 
+import pickle
+
 from netbox_geo.core.exceptions import (
+    DataImportError,
     DataValidationError,
-    ImportError,
     NetBoxAPIError,
     RateLimitError,
 )
@@ -29,9 +31,17 @@ def test_data_validation_error() -> None:
     assert error.field == "country_code"
 
 
-def test_import_error() -> None:
-    """Test ImportError creation and attributes."""
-    error = ImportError("Import failed", source="geonames", record_id="123")
+def test_data_import_error() -> None:
+    """Test DataImportError creation and attributes."""
+    error = DataImportError("Import failed", source="geonames", record_id="123")
     assert "Import failed" in str(error)
     assert error.source == "geonames"
     assert error.record_id == "123"
+
+
+def test_exception_attributes_survive_pickling() -> None:
+    """Test slotted exception attributes are kept across pickling."""
+    error = pickle.loads(pickle.dumps(NetBoxAPIError("Test error", status_code=503)))
+    assert str(error) == "Test error"
+    assert error.status_code == 503
+    assert error.__dict__ == {}
@@ -0,0 +1,60 @@
+"""Unit tests for the memcached client's in-process cache."""
+
+import copy
+from typing import Any
+
+from app.core.cache.memcached import MemcachedClient
+
+
+class CountingBackend:
+    """Backend that serves fixed values and counts round trips."""
+
+    def __init__(self, values: dict[str, Any]) -> None:
+        """Initialize with values keyed by namespaced key."""
+        self.values = values
+        self.calls = 0
+
+    def get(self, key: str) -> Any:
+        """Return a fresh copy of a stored value, as unpickling would."""
+        self.calls += 1
+        return copy.deepcopy(self.values.get(key))
+
+    def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """Return the stored values among keys."""
+        self.calls += 1
+        return {key: self.values[key] for key in keys if key in self.values}
+
+
+def make_client(values: dict[str, Any]) -> MemcachedClient:
+    """Create a client whose backend serves values."""
+    client = MemcachedClient(["localhost:11211"])
+    client.client = CountingBackend({f"app:{key}": value for key, value in values.items()})
+    return client
+
+
+def test_immutable_values_are_cached_locally() -> None:
+    """Test a repeated get of a bytes value skips the backend."""
+    client = make_client({"flag": b"1:7"})
+
+    assert client.get("flag") == b"1:7"
+    assert client.get("flag") == b"1:7"
+    assert client.client.calls == 1
+
+
+def test_mutable_values_are_not_shared() -> None:
+    """Test mutating a returned dict does not leak into later gets."""
+    client = make_client({"profile": {"name": "a"}})
+
+    client.get("profile")["name"] = "mutated"
+
+    assert client.get("profile") == {"name": "a"}
+    assert client.client.calls == 2
+
+
+def test_get_many_can_bypass_local_cache() -> None:
+    """Test use_local=False always reads from the backend."""
+    client = make_client({"rbac_revision": 7})
+
+    client.get_many(["rbac_revision"])
+    assert client.get_many(["rbac_revision"], use_local=False) == {"rbac_revision": 7}
+    assert client.client.calls == 2
@@ -0,0 +1,58 @@
+"""Unit tests for API middlewares."""
+
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from src.api.middleware import SelectiveGZipMiddleware, SelectiveSessionMiddleware
+
+LARGE_BODY = "x" * 4096
+
+
+def large_response(request):  # type: ignore[no-untyped-def]
+    """Return a compressible body."""
+    return PlainTextResponse(LARGE_BODY)
+
+
+def make_client() -> TestClient:
+    """Create a client for an app wrapped in SelectiveGZipMiddleware."""
+    app = Starlette(
+        routes=[Route("/large", large_response), Route("/skip", large_response)],
+    )
+    wrapped = SelectiveGZipMiddleware(app, minimum_size=1400, exclude_paths=("/skip",))
+    return TestClient(wrapped)
+
+
+def test_gzip_compresses_large_responses() -> None:
+    """Test bodies above minimum_size are compressed."""
+    response = make_client().get("/large", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.text == LARGE_BODY
+
+
+def test_gzip_skips_excluded_paths() -> None:
+    """Test excluded paths are passed through uncompressed."""
+    response = make_client().get("/skip", headers={"Accept-Encoding": "gzip"})
+
+    assert "content-encoding" not in response.headers
+    assert response.text == LARGE_BODY
+
+
+def session_response(request):  # type: ignore[no-untyped-def]
+    """Return whether the session was loaded."""
+    return PlainTextResponse(str("session" in request.scope))
+
+
+def test_session_skips_excluded_paths() -> None:
+    """Test excluded paths get no session scope."""
+    app = Starlette(
+        routes=[Route("/health", session_response), Route("/page", session_response)],
+    )
+    client = TestClient(
+        SelectiveSessionMiddleware(app, secret_key="test", exclude_paths=("/health",))
+    )
+
+    assert client.get("/health").text == "False"
+    assert client.get("/page").text == "True"
@@ -0,0 +1,33 @@
+"""Unit tests for the RBAC models."""
+
+from app.core.models import Permission, Role, User
+
+
+def make_role(name: str, *permission_names: str) -> Role:
+    """Create an active role granting active permissions."""
+    permissions = [Permission(name=perm, is_active=True) for perm in permission_names]
+    return Role(name=name, is_active=True, permissions=permissions)
+
+
+def test_permission_names_follow_role_changes() -> None:
+    """Test permission names are recomputed after the user's roles change."""
+    user = User(username="alice", is_superuser=False)
+    user.roles.append(make_role("viewer", "device.view"))
+
+    assert user.permission_names == {"device.view"}
+    assert not user.has_permission("device.change")
+
+    user.roles.append(make_role("editor", "device.change"))
+
+    assert user.has_permission("device.change")
+    assert user.permission_names == {"device.view", "device.change"}
+
+
+def test_permission_names_skip_inactive_roles() -> None:
+    """Test permissions of an inactive role are not granted."""
+    user = User(username="bob", is_superuser=False)
+    role = make_role("viewer", "device.view")
+    role.is_active = False
+    user.roles.append(role)
+
+    assert user.permission_names == frozenset()
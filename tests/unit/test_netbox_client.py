@@ -0,0 +1,179 @@
+"""Unit tests for the asynchronous NetBox client."""
+
+import asyncio
+import json
+from typing import Any
+
+import httpx
+import pynetbox
+import pytest
+import requests
+
+from netbox_geo.core.config import NetBoxConfig
+from netbox_geo.core.exceptions import NetBoxAPIError
+from netbox_geo.netbox.client import AsyncNetBoxClient, NetBoxClient, backoff_delay
+
+
+def make_client(transport: httpx.MockTransport, **kwargs: Any) -> AsyncNetBoxClient:
+    """Create a client whose requests are answered by a mock transport."""
+    client = AsyncNetBoxClient(
+        NetBoxConfig(url="https://netbox.example.com", token="test-token", max_retries=1),
+        **kwargs,
+    )
+    client._client = httpx.AsyncClient(
+        base_url="https://netbox.example.com/api/",
+        headers=client._client.headers,
+        transport=transport,
+    )
+    return client
+
+
+def test_backoff_delay_is_capped() -> None:
+    """Test backoff delays stay within the capped exponential window."""
+    for attempt in range(10):
+        assert 0 <= backoff_delay(attempt, max_wait=5.0) <= min(5.0, 2**attempt)
+
+
+@pytest.mark.asyncio
+async def test_aget_follows_pagination() -> None:
+    """Test aget collects results from every page."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.headers["Authorization"] == "Token test-token"
+        if request.url.params.get("offset") == "1":
+            return httpx.Response(200, json={"next": None, "results": [{"id": 2}]})
+        next_url = "https://netbox.example.com/api/dcim/sites/?limit=1&offset=1"
+        return httpx.Response(200, json={"next": next_url, "results": [{"id": 1}]})
+
+    async with make_client(httpx.MockTransport(handler)) as client:
+        assert await client.aget("dcim.sites", limit=1) == [{"id": 1}, {"id": 2}]
+
+
+@pytest.mark.asyncio
+async def test_abulk_create_sends_single_request() -> None:
+    """Test abulk_create posts the whole list at once."""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(201, json=json.loads(request.content))
+
+    data = [{"name": "a"}, {"name": "b"}]
+    async with make_client(httpx.MockTransport(handler)) as client:
+        assert await client.abulk_create("dcim/regions", data) == data
+
+    assert len(requests) == 1
+    assert requests[0].url.path == "/api/dcim/regions/"
+
+
+@pytest.mark.asyncio
+async def test_unavailable_is_retried(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test 503 responses are retried after a backoff."""
+    responses = [httpx.Response(503), httpx.Response(201, json={"id": 1})]
+    delays: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        delays.append(delay)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    transport = httpx.MockTransport(lambda request: responses.pop(0))
+    async with make_client(transport) as client:
+        assert await client.acreate("dcim.sites", {"name": "a"}) == {"id": 1}
+
+    assert len(delays) == 1
+
+
+@pytest.mark.asyncio
+async def test_client_error_is_not_retried() -> None:
+    """Test 4xx responses raise immediately with the status code."""
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(400, json={"name": ["required"]})
+
+    async with make_client(httpx.MockTransport(handler)) as client:
+        with pytest.raises(NetBoxAPIError) as exc_info:
+            await client.acreate("dcim.sites", {})
+
+    assert exc_info.value.status_code == 400
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_abulk_create_splits_batches() -> None:
+    """Test abulk_create posts one request per batch."""
+    sizes: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        sizes.append(len(body))
+        return httpx.Response(201, json=body)
+
+    data = [{"name": str(i)} for i in range(5)]
+    async with make_client(httpx.MockTransport(handler)) as client:
+        assert await client.abulk_create("dcim.regions", data, batch_size=2) == data
+
+    assert sizes == [2, 2, 1]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_are_capped() -> None:
+    """Test no more than max_concurrent requests are in flight at once."""
+    in_flight = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(201, json={"id": 1})
+
+    async with make_client(httpx.MockTransport(handler), max_concurrent=2) as client:
+        await asyncio.gather(*(client.acreate("dcim.sites", {}) for _ in range(6)))
+
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_retry_after_is_honoured(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test a 429 waits for the server's Retry-After instead of backing off."""
+    responses = [
+        httpx.Response(429, headers={"Retry-After": "2"}),
+        httpx.Response(201, json={"id": 1}),
+    ]
+    delays: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        delays.append(delay)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    transport = httpx.MockTransport(lambda request: responses.pop(0))
+    async with make_client(transport) as client:
+        assert await client.acreate("dcim.sites", {"name": "a"}) == {"id": 1}
+
+    assert delays == [2.0]
+
+
+def test_sync_client_error_is_not_retried() -> None:
+    """Test the sync client raises 4xx pynetbox errors without retrying."""
+    client = NetBoxClient(NetBoxConfig(url="https://netbox.example.com", token="test-token"))
+    response = requests.Response()
+    response.status_code = 404
+    response.url = "https://netbox.example.com/api/dcim/sites/1/"
+    response.request = requests.Request("GET", response.url).prepare()
+    calls = 0
+
+    def fail() -> None:
+        nonlocal calls
+        calls += 1
+        raise pynetbox.RequestError(response)
+
+    with pytest.raises(NetBoxAPIError) as exc_info:
+        client._retry_with_backoff(fail)
+
+    assert exc_info.value.status_code == 404
+    assert calls == 1
@@ -1,5 +1,6 @@
 """Unit tests for rate limiter."""
 
+import threading
 import time
 
 import pytest
@@ -15,6 +16,12 @@ def test_rate_limiter_initialization() -> None:
     assert limiter.max_tokens == 60.0
 
 
+def test_rate_limiter_rejects_non_positive_rate() -> None:
+    """Test RateLimiter requires a positive call rate."""
+    with pytest.raises(ValueError):
+        RateLimiter(calls_per_minute=0)
+
+
 def test_rate_limiter_acquire_tokens() -> None:
     """Test acquiring tokens from rate limiter."""
     limiter = RateLimiter(calls_per_minute=60)
@@ -41,6 +48,26 @@ def test_rate_limiter_context_manager() -> None:
         pass  # Context manager should work without errors
 
 
+def test_rate_limiter_context_manager_refunds_on_error() -> None:
+    """Test a failed block returns its token."""
+    limiter = RateLimiter(calls_per_minute=60)
+    limiter.tokens = 1
+
+    with pytest.raises(RuntimeError):
+        with limiter:
+            raise RuntimeError("request failed")
+
+    assert limiter.acquire(tokens=1, blocking=False) is True
+
+
+def test_rate_limiter_release_caps_at_max_tokens() -> None:
+    """Test releasing tokens never overfills the bucket."""
+    limiter = RateLimiter(calls_per_minute=60)
+    limiter.release(tokens=10)
+
+    assert limiter.tokens <= limiter.max_tokens
+
+
 def test_rate_limiter_refill() -> None:
     """Test that tokens refill over time."""
     limiter = RateLimiter(calls_per_minute=60)
@@ -49,6 +76,49 @@ def test_rate_limiter_refill() -> None:
 
     # Wait a bit for refill
     time.sleep(0.1)
-    limiter._refill()
 
     assert limiter.tokens > initial_tokens
+
+
+def test_rate_limiter_blocking_reserves_tokens() -> None:
+    """Test a blocking acquire reserves its tokens before waiting."""
+    limiter = RateLimiter(calls_per_minute=600)
+    limiter.tokens = 0
+
+    start = time.monotonic()
+    assert limiter.acquire(tokens=1) is True
+    assert time.monotonic() - start >= 0.09
+
+    # The reservation has been paid back, so the bucket is empty again but never negative
+    assert 0 <= limiter.tokens < 1
+
+
+def test_rate_limiter_ignores_wall_clock_jumps(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test a backward wall-clock jump does not stall the limiter."""
+    limiter = RateLimiter(calls_per_minute=60)
+    wall_clock = time.time()
+    monkeypatch.setattr(time, "time", lambda: wall_clock - 3600)
+
+    for _ in range(10):
+        assert limiter.acquire(tokens=1, blocking=False) is True
+
+
+def test_rate_limiter_staggers_concurrent_waiters() -> None:
+    """Test concurrent blocking callers wake one token interval apart, not together."""
+    limiter = RateLimiter(calls_per_minute=600)  # one token every 0.1s
+    limiter.tokens = 0
+    start = time.monotonic()
+    waited: list[float] = []
+
+    def worker() -> None:
+        limiter.acquire(tokens=1)
+        waited.append(time.monotonic() - start)
+
+    threads = [threading.Thread(target=worker) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    waited.sort()
+    assert all(later - earlier >= 0.08 for earlier, later in zip(waited, waited[1:]))
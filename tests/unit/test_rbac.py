@@ -0,0 +1,59 @@
+"""Unit tests for RBAC check caching."""
+
+import os
+from typing import Any
+
+import pytest
+
+pytest.importorskip("django")
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.testing")
+
+from app.core import rbac  # noqa: E402
+from app.core.rbac import RBACManager  # noqa: E402
+
+
+@pytest.fixture
+def cache_writes(monkeypatch: pytest.MonkeyPatch) -> dict[str, int]:
+    """Record the memcached timeout of every cache write."""
+    writes: dict[str, int] = {}
+
+    def cache_set(key: str, value: Any, timeout: int | None = None) -> bool:
+        writes[key] = timeout  # type: ignore[assignment]
+        return True
+
+    monkeypatch.setattr(rbac, "cache_set", cache_set)
+    monkeypatch.setattr(rbac, "cache_get_many", lambda keys, **kwargs: {rbac.RBAC_REVISION_KEY: 1})
+    return writes
+
+
+def test_denied_check_for_unknown_user_uses_negative_timeout(
+    cache_writes: dict[str, int], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test a denial computed from an empty permission set expires quickly."""
+    manager = RBACManager(cache_timeout=300, local_cache_ttl=0, negative_cache_timeout=30)
+    monkeypatch.setattr(manager, "get_user_permissions", lambda user_id: set())
+
+    assert manager.has_permission("user-1", "sites.view") is False
+    assert cache_writes["user_perm:user-1:sites.view"] == 30
+
+
+def test_denied_check_for_known_user_uses_full_timeout(
+    cache_writes: dict[str, int], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test a denial for a user with other permissions keeps the full timeout."""
+    manager = RBACManager(cache_timeout=300, local_cache_ttl=0, negative_cache_timeout=30)
+    monkeypatch.setattr(manager, "get_user_permissions", lambda user_id: {"sites.add"})
+
+    assert manager.has_permission("user-1", "sites.view") is False
+    assert cache_writes["user_perm:user-1:sites.view"] == 300
+
+
+def test_role_check_for_unknown_user_uses_negative_timeout(
+    cache_writes: dict[str, int], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test a role denial computed from no roles expires quickly."""
+    manager = RBACManager(cache_timeout=300, local_cache_ttl=0, negative_cache_timeout=30)
+    monkeypatch.setattr(manager, "get_user_roles", lambda user_id: set())
+
+    assert manager.has_role("user-1", "admin") is False
+    assert cache_writes["user_role:user-1:admin"] == 30